@@ -3,11 +3,25 @@ import os
 import sys
 import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple, Union
 import sqlite3
 import json
+import io
+import glob
+import hashlib
+import mmap
+import pickle
+import shutil
+import tempfile
+import importlib.util
+import warnings
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from bs4 import BeautifulSoup
 import yaml
+import xlrd
 #from lxml import objectify
 # - If a package and a module within the package is to be imported
 #   uncomment the following lines where dir is the directory containing
@@ -28,6 +42,26 @@ __version__ = "1.0"
 # ================================================================================
 # Insert Code here
 
+# The conversion applied to the text following a key word for each data type
+# accepted by ``ReadTextFileKeywords.read_many``.  The ``read_`` methods of
+# the class use the same conversions
+_KEYWORD_CONVERTERS = {
+    'double': lambda text: np.float64(text.split()[0]),
+    'double_list': lambda text: list(_parse_numeric_text(text, np.float64)),
+    'float': lambda text: np.float32(text.split()[0]),
+    'float_list': lambda text: list(_parse_numeric_text(text, np.float32)),
+    'integer': lambda text: np.int32(text.split()[0]),
+    'integer_list': lambda text: list(_parse_numeric_text(text, np.int32)),
+    'sentence': lambda text: ' '.join(text.split()),
+    'string': lambda text: str(text.split()[0]),
+    'string_list': lambda text: [str(value) for value in text.split()]
+}
+
+_SIDECAR_VERSION = 1
+_WHERE_CHUNKSIZE = 100000
+_NARROW_INTEGERS = {'i': [np.int8, np.int16, np.int32],
+                    'u': [np.uint8, np.uint16, np.uint32]}
+
 
 class ReadTextFileKeywords:
     """
@@ -38,6 +72,28 @@ class ReadTextFileKeywords:
 
     :param file_name: The name of the file being read to include the
                       path-link
+    :param stream: True if the file is to be searched in place for each
+                   key word rather than parsed into an index, False by
+                   default.  This mode is intended for very large files,
+                   such as simulation logs, where the key word is near
+                   the top of the file or only a few key words are read.
+    :param cache_dir: A directory in which the parsed index of the file is
+                      saved, so that later processes can load it instead of
+                      parsing the file again.  Defaulted to None, in which
+                      case no index is saved.  The directory containing the
+                      file can be used to save the index alongside it.
+
+    By default the file is parsed once into an index of lines, and each
+    read is a look-up in that index.  When ``stream`` is True the file is
+    memory mapped and searched for the key word on every read, stopping at
+    the first matching line, so memory use does not grow with the size of
+    the file.
+
+    When ``cache_dir`` is used the index is written to a binary file in that
+    directory, and it is only reused if the modification time, size and
+    content hash of the text file are unchanged.  The saved index is read
+    with ``pickle``, so the directory should only be writable by trusted
+    users.
 
     For the purposes of demonstrating the use of this class, assume
     a text file titled ``test_file.txt`` with the following contents.
@@ -54,10 +110,73 @@ class ReadTextFileKeywords:
         double list: 1.12321 344.3454453 21.434553
         integer list: 1 2 3 4 5 6 7
     """
-    def __init__(self, file_name: str):
+    def __init__(self, file_name: str, stream: bool = False,
+                 cache_dir: str = None):
         self.file_name = file_name
+        self.stream = stream
+        self.cache_dir = cache_dir
         if not os.path.isfile(file_name):
             sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+        self._index = None
+# ----------------------------------------------------------------------------
+
+    def read_array_block(self, key_words: str, rows: int = None,
+                         data_type: type = np.float64) -> np.ndarray:
+        """
+
+        :param key_words: The key word that proceeds the data to be
+                          read
+        :param rows: The number of rows to be read.  Defaulted to None,
+                     in which case all rows of the block are read
+        :param data_type: The numpy data type of the array.  Defaulted to
+                          ``numpy.float64``
+        :return data: A two dimensional numpy array containing the block
+                      of numbers on the lines following the **key_word**
+
+        This function reads a text file and searches for a key word which
+        can be a single word or a string of words.  This function will read
+        the table of white space separated numbers on the lines below the
+        key word(s) as a two dimensional array.  The table ends at a blank
+        line, at a line that does not begin with a number, such as the next
+        key word, or at the end of the file.  The lines are parsed directly
+        into the array, and each line can be followed by a comment.  A
+        ValueError is raised if the rows do not contain the same number of
+        values.
+        For example, assume a file titled ``table.txt`` with the
+        following contents.
+
+        .. code-block:: text
+
+            temperature table:
+            1.0 300.0 301.5
+            2.0 310.0 311.2
+            3.0 320.0 321.8
+
+            pressure: 101.3
+
+        .. code-block:: python
+
+            > dat = ReadTextFileKeywords('table.txt')
+            > table = dat.read_array_block('temperature table:')
+            > print(table.shape)
+            (3, 3)
+        """
+        block = []
+        for line in self._first_match(key_words)[1]:
+            if rows is not None and len(block) == rows:
+                break
+            if not line or not _is_number(line.split(None, 1)[0]):
+                break
+            block.append(line.split('#', 1)[0])
+        if not block:
+            return np.empty((0, 0), dtype=data_type)
+        columns = {len(line.split()) for line in block}
+        if len(columns) > 1:
+            raise ValueError('{}{}{}'.format('The table following ', key_words,
+                                             ' does not have the same number of '
+                                             'values on every row'))
+        values = _parse_numeric_text('\n'.join(block), data_type)
+        return values.reshape(len(block), columns.pop())
 # ----------------------------------------------------------------------------
 
     def read_double(self, key_words: str) -> np.float64:
@@ -83,16 +202,18 @@ class ReadTextFileKeywords:
             > print(double_data)
             3.141596235941
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        return np.float64(values[0])
+        return _KEYWORD_CONVERTERS['double'](self._read_value_text(key_words))
 # ----------------------------------------------------------------------------
 
-    def read_double_list(self, key_words: str) -> List[np.float64]:
+    def read_double_list(self, key_words: str,
+                         as_array: bool = False) -> Union[List[np.float64], np.ndarray]:
         """
 
         :param key_words: The key word that proceeds the data to be
                           read
+        :param as_array: True if the data is to be returned as a contiguous
+                         numpy array parsed in a single vectorized step,
+                         False by default
         :return data: The string values following the **key_word** on the
                       text file.  This variable is returned as a List of
                       string values
@@ -110,10 +231,9 @@ class ReadTextFileKeywords:
             > print(str_data)
             [1.12321, 344.3454453, 21.434553]
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        values = [np.float64(value) for value in values]
-        return values
+        if as_array:
+            return _parse_numeric_text(self._read_value_text(key_words), np.float64)
+        return _KEYWORD_CONVERTERS['double_list'](self._read_value_text(key_words))
 # ----------------------------------------------------------------------------
 
     def read_float(self, key_words: str) -> np.float32:
@@ -139,16 +259,18 @@ class ReadTextFileKeywords:
            > print(float_data)
            3.1415
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        return np.float32(values[0])
+        return _KEYWORD_CONVERTERS['float'](self._read_value_text(key_words))
 # ----------------------------------------------------------------------------
 
-    def read_float_list(self, key_words: str) -> List[np.float32]:
+    def read_float_list(self, key_words: str,
+                        as_array: bool = False) -> Union[List[np.float32], np.ndarray]:
         """
 
         :param key_words: The key word that proceeds the data to be
                           read
+        :param as_array: True if the data is to be returned as a contiguous
+                         numpy array parsed in a single vectorized step,
+                         False by default
         :return data: The string values following the **key_word** on the
                       text file.  This variable is returned as a List of
                       numpy.float32 values
@@ -166,10 +288,9 @@ class ReadTextFileKeywords:
             > print(float_data)
             [1.2, 3.4, 4.5, 5.6, 6.7]
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        values = [np.float32(value) for value in values]
-        return values
+        if as_array:
+            return _parse_numeric_text(self._read_value_text(key_words), np.float32)
+        return _KEYWORD_CONVERTERS['float_list'](self._read_value_text(key_words))
 # ----------------------------------------------------------------------------
 
     def read_integer(self, key_words: str) -> np.int32:
@@ -194,16 +315,18 @@ class ReadTextFileKeywords:
            > print(int_data)
            3
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        return np.int32(values[0])
+        return _KEYWORD_CONVERTERS['integer'](self._read_value_text(key_words))
 # ----------------------------------------------------------------------------
 
-    def read_integer_list(self, key_words: str) -> List[np.int32]:
+    def read_integer_list(self, key_words: str,
+                          as_array: bool = False) -> Union[List[np.int32], np.ndarray]:
         """
 
         :param key_words: The key word that proceeds the data to be
                           read
+        :param as_array: True if the data is to be returned as a contiguous
+                         numpy array parsed in a single vectorized step,
+                         False by default
         :return data: The string values following the **key_word** on the
                       text file.  This variable is returned as a List of
                       numpy.float32 values
@@ -221,10 +344,116 @@ class ReadTextFileKeywords:
             > print(float_data)
             [1, 2, 3, 4, 5, 6, 7]
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        values = [np.int32(value) for value in values]
-        return values
+        if as_array:
+            return _parse_numeric_text(self._read_value_text(key_words), np.int32)
+        return _KEYWORD_CONVERTERS['integer_list'](self._read_value_text(key_words))
+# ----------------------------------------------------------------------------
+
+    def iter_occurrences(self, key_words: str,
+                         data_type: str = 'double') -> Iterator:
+        """
+
+        :param key_words: The key word that proceeds the data to be
+                          read
+        :param data_type: The type of data following the key word.  Types
+                          are limited to those accepted by ``read_many``.
+                          Defaulted to ``double``
+        :return data: An iterator over the value following every occurrence
+                      of the **key_word** in the text file
+
+        The ``read_`` methods of this class only return the data following
+        the first occurrence of a key word.  This function yields the data
+        following every line that begins with the key word(s), in the order
+        in which they appear in the file, which allows a time history to
+        be read from a log file.  When the class is used in stream mode the
+        file is searched a single time, and only one value is held in
+        memory at once.  Assume a file titled ``solver.log`` with the
+        following contents.
+
+        .. code-block:: text
+
+            iteration: 1
+            residual: 1.0e-1
+            iteration: 2
+            residual: 1.0e-3
+
+        .. code-block:: python
+
+            > dat = ReadTextFileKeywords('solver.log', stream=True)
+            > for value in dat.iter_occurrences('residual:'):
+            >     print(value)
+            0.1
+            0.001
+        """
+        if data_type not in _KEYWORD_CONVERTERS:
+            sys.exit('{}{}{}'.format('FATAL ERROR: ', data_type,
+                                     ' is not a supported data type'))
+        for text, _ in self._matches(key_words):
+            yield _KEYWORD_CONVERTERS[data_type](text)
+# ----------------------------------------------------------------------------
+
+    def read_occurrences(self, key_words: str,
+                         data_type: type = np.float64) -> np.ndarray:
+        """
+
+        :param key_words: The key word that proceeds the data to be
+                          read
+        :param data_type: The numpy data type of the array.  Defaulted to
+                          ``numpy.float64``
+        :return data: A numpy array containing the first value following
+                      every occurrence of the **key_word** in the text file
+
+        This function is similar to ``iter_occurrences``; however, the
+        values are written directly into a growing numpy array rather than
+        being returned one at a time.
+
+        .. code-block:: python
+
+            > dat = ReadTextFileKeywords('solver.log', stream=True)
+            > print(dat.read_occurrences('residual:'))
+            [0.1   0.001]
+        """
+        values = (text.split()[0] for text, _ in self._matches(key_words))
+        return np.fromiter(values, dtype=data_type)
+# ----------------------------------------------------------------------------
+
+    def read_many(self, schema: Dict[str, str]) -> Dict:
+        """
+
+        :param schema: A dictionary mapping each key word to the type of data
+                       that follows it.  Types are limited to ``double``,
+                       ``double_list``, ``float``, ``float_list``,
+                       ``integer``, ``integer_list``, ``sentence``,
+                       ``string`` and ``string_list``
+        :return data: A dictionary mapping each key word to the value read
+                      from the text file
+
+        This function reads several variables from the text file at once,
+        and each value is returned with the same data type as the
+        corresponding ``read_`` method of this class.  Unless the class was
+        created with ``stream=True``, the file is only parsed a single time
+        regardless of the number of key words, and each key word is found
+        in the saved index.  In stream mode each key word is searched for
+        separately in the memory mapped file.
+
+        .. code-block:: python
+
+            > dat = ReadTextFileKeywords('test_file.txt')
+            > schema = {'double:': 'double', 'integer list:': 'integer_list',
+                        'String:': 'string'}
+            > data = dat.read_many(schema)
+            > print(data)
+            {'double:': 3.141596235941, 'integer list:': [1, 2, 3, 4, 5, 6, 7],
+             'String:': 'test'}
+        """
+        data = {}
+        for key_words, data_type in schema.items():
+            if data_type not in _KEYWORD_CONVERTERS:
+                sys.exit('{}{}{}'.format('FATAL ERROR: ', data_type,
+                                         ' is not a supported data type'))
+            convert = _KEYWORD_CONVERTERS[data_type]
+            data[key_words] = convert(self._read_value_text(key_words))
+        return data
 # ----------------------------------------------------------------------------
 
     def read_sentence(self, key_words: str) -> str:
@@ -249,27 +478,83 @@ class ReadTextFileKeywords:
            > print(str_data)
            'This is a short sentence!'
         """
-        input_words = key_words.split()
-        with open(self.file_name) as Input_File:
-            lines = Input_File.readlines()
-            for line in lines:
-                variable = line.split()
-                counter = 0
-                for i in range(len(input_words)):
-                    if input_words[i] != variable[i]:
-                        break
-                    else:
-                        counter += 1
-                if counter == len(input_words):
-                    start = len(input_words)
-                    end = len(variable)
-                    word = ''
-                    for i in range(start, end):
-                        word = word + ' ' + variable[i]
-                    return word.lstrip()
+        return _KEYWORD_CONVERTERS['sentence'](self._read_value_text(key_words))
+# ----------------------------------------------------------------------------
+
+    def _read_value_text(self, key_words: str) -> str:
+        """
+
+        :param key_words: The key word that proceeds the data to be
+                          read
+        :return data: The raw text following the **key_word** on the first
+                      line that begins with the key word(s)
+        """
+        return self._first_match(key_words)[0]
+# ----------------------------------------------------------------------------
+
+    def _first_match(self, key_words: str) -> Tuple[str, Iterator[str]]:
+        """
+
+        :param key_words: The key word that proceeds the data to be
+                          read
+        :return match: The first item produced by ``_matches``
+        """
+        for match in self._matches(key_words):
+            return match
         sys.exit('{}{}{}'.format(key_words, " Keywords not found in ", self.file_name))
 # ----------------------------------------------------------------------------
 
+    def _matches(self, key_words: str) -> Iterator[Tuple[str, Iterator[str]]]:
+        """
+
+        :param key_words: The key word that proceeds the data to be
+                          read
+        :return matches: An iterator over every line that begins with the
+                         key word(s), in file order.  Each item contains the
+                         raw text following the key word(s) and a lazy
+                         iterator over the lines after the match, with
+                         leading and trailing white space removed
+
+        In the default mode the file is parsed once into an index of lines
+        keyed by their first word, so that every look-up is a dictionary
+        probe followed by a prefix comparison against the few lines sharing
+        that word.  In stream mode the memory mapped file is searched for
+        the first word of the key word(s), and only the lines containing
+        it are decoded and compared.
+        """
+        input_words = key_words.split()
+        if not self.stream:
+            lines, words = self._keyword_index()
+            for line_number in words.get(input_words[0], []):
+                text = _value_text(lines[line_number], input_words)
+                if text is not None:
+                    yield text, (lines[i] for i in range(line_number + 1, len(lines)))
+        elif os.path.getsize(self.file_name) > 0:
+            with open(self.file_name, 'rb') as Input_File:
+                data = mmap.mmap(Input_File.fileno(), 0, access=mmap.ACCESS_READ)
+            target = input_words[0].encode()
+            position = data.find(target)
+            while position != -1:
+                start = data.rfind(b'\n', 0, position) + 1
+                end = data.find(b'\n', position)
+                if end == -1:
+                    end = len(data)
+                text = _value_text(data[start:end].decode(), input_words)
+                if text is not None:
+                    yield text, _mapped_lines(data, end + 1)
+                position = data.find(target, end)
+# ----------------------------------------------------------------------------
+
+    def _keyword_index(self) -> Tuple[List[str], Dict[str, List[int]]]:
+        """
+
+        :return index: The keyword index of the file being read
+        """
+        if self._index is None:
+            self._index = _load_keyword_index(self.file_name, self.cache_dir)
+        return self._index
+# ----------------------------------------------------------------------------
+
     def read_string(self, key_words: str) -> str:
         """
 
@@ -293,9 +578,7 @@ class ReadTextFileKeywords:
            > print(str_data)
            'test'
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        return str(values[0])
+        return _KEYWORD_CONVERTERS['string'](self._read_value_text(key_words))
 # ----------------------------------------------------------------------------
 
     def read_string_list(self, key_words: str) -> List[str]:
@@ -320,17 +603,515 @@ class ReadTextFileKeywords:
             > print(str_data)
             ['This', 'is', 'a', 'short', 'sentence!']
         """
-        values = self.read_sentence(key_words)
-        values = values.split()
-        values = [str(value) for value in values]
-        return values
+        return _KEYWORD_CONVERTERS['string_list'](self._read_value_text(key_words))
+# ----------------------------------------------------------------------------
+
+
+def _index_keyword_file(file_name: str) -> Tuple[List[str], Dict[str, List[int]]]:
+    """
+
+    :param file_name: The name of the file being read to include the
+                      path-link
+    :return index: A tuple containing a list of every line in the file,
+                   with leading and trailing white space removed, and a
+                   dictionary mapping the first word of every non-blank
+                   line to the numbers of the lines that begin with that
+                   word, in the order in which they appear in the file
+
+    This function reads a keyword file in a single pass and builds the
+    index used by the ``ReadTextFileKeywords`` class.
+    """
+    lines = []
+    words = {}
+    with open(file_name) as Input_File:
+        for line in Input_File:
+            line = line.strip()
+            if line:
+                words.setdefault(line.split(None, 1)[0], []).append(len(lines))
+            lines.append(line)
+    return lines, words
+# ----------------------------------------------------------------------------
+
+
+def _value_text(line: str, input_words: List[str]) -> Union[str, None]:
+    """
+
+    :param line: A single line read from a keyword file
+    :param input_words: The key word(s) split into a list of words
+    :return text: The raw text following the key word(s), or None if the
+                  line does not begin with the key word(s)
+    """
+    variable = line.split(None, len(input_words))
+    if variable[:len(input_words)] != input_words:
+        return None
+    if len(variable) > len(input_words):
+        return variable[-1]
+    return ''
+# ----------------------------------------------------------------------------
+
+
+def _mapped_lines(data: mmap.mmap, start: int) -> Iterator[str]:
+    """
+
+    :param data: A memory mapped file
+    :param start: The byte offset at which the first line begins
+    :return lines: An iterator over the lines of the file from **start**
+                   onward, with leading and trailing white space removed
+    """
+    while start < len(data):
+        end = data.find(b'\n', start)
+        if end == -1:
+            end = len(data)
+        yield data[start:end].decode().strip()
+        start = end + 1
+# ----------------------------------------------------------------------------
+
+
+def _is_number(word: str) -> bool:
+    """
+
+    :param word: A single word read from a file
+    :return status: True if the word can be read as a number, False otherwise
+    """
+    try:
+        float(word)
+    except ValueError:
+        return False
+    return True
+# ----------------------------------------------------------------------------
+
+
+def _parse_numeric_text(text: str, data_type: type) -> np.ndarray:
+    """
+
+    :param text: A string of white space separated numbers, which can be
+                 followed by a comment beginning with ``#``
+    :param data_type: The numpy data type of the returned array
+    :return values: A numpy array of the numbers in **text**
+
+    The numbers are parsed directly into a 64 bit array without creating
+    an intermediate list of strings or numpy scalars, and then converted to
+    **data_type**.  A ValueError is raised if the text contains a value that
+    can not be read as a number, or an integer that does not fit in
+    **data_type**.
+    """
+    text = text.split('#', 1)[0]
+    data_type = np.dtype(data_type)
+    wide = np.int64 if data_type.kind in 'iu' else np.float64
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            values = np.fromstring(text, dtype=wide, sep=' ')
+        except (ValueError, DeprecationWarning):
+            raise ValueError('{}{}{}'.format(' '.join(text.split()),
+                                             ' can not be read as ',
+                                             data_type.name)) from None
+    if data_type.kind in 'iu' and values.size > 0:
+        limits = np.iinfo(data_type)
+        # Values that do not fit in 64 bits are saturated by numpy
+        if values.min() < limits.min or values.max() > limits.max or \
+                values.max() == np.iinfo(np.int64).max:
+            raise ValueError('{}{}{}'.format(' '.join(text.split()),
+                                             ' is out of range for ',
+                                             data_type.name))
+    return values.astype(data_type)
+# ----------------------------------------------------------------------------
+
+
+def _sidecar_name(file_name: str, cache_dir: str) -> str:
+    """
+
+    :param file_name: The absolute path of the keyword file
+    :param cache_dir: The directory in which the index is saved
+    :return sidecar: The name of the file in which the index is saved
+    """
+    digest = hashlib.blake2b(file_name.encode(), digest_size=8).hexdigest()
+    return os.path.join(cache_dir, '{}.{}.kwidx'.format(os.path.basename(file_name),
+                                                       digest))
+# ----------------------------------------------------------------------------
+
+
+def _hash_file(file_name: str) -> str:
+    """
+
+    :param file_name: The name of the file being read to include the
+                      path-link
+    :return digest: A hash of the contents of the file
+    """
+    digest = hashlib.blake2b()
+    with open(file_name, 'rb') as Input_File:
+        for chunk in iter(lambda: Input_File.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+# ----------------------------------------------------------------------------
+
+
+def _read_sidecar(file_name: str, cache_dir: str, mtime_ns: int,
+                  size: int) -> Union[Tuple[List[str], Dict[str, List[int]]], None]:
+    """
+
+    :param file_name: The absolute path of the keyword file
+    :param cache_dir: The directory in which the index is saved
+    :param mtime_ns: The modification time of the file in nanoseconds
+    :param size: The size of the file in bytes
+    :return index: The saved keyword index, or None if the index does not
+                   exist, can not be loaded, or the file has changed since it
+                   was saved
+    """
+    try:
+        with open(_sidecar_name(file_name, cache_dir), 'rb') as Input_File:
+            header = pickle.load(Input_File)
+            if header[:4] != (_SIDECAR_VERSION, file_name, mtime_ns, size) or \
+                    header[4] != _hash_file(file_name):
+                return None
+            lines, words = pickle.load(Input_File)
+    except Exception:
+        return None
+    if not isinstance(lines, list) or not isinstance(words, dict):
+        return None
+    return lines, words
+# ----------------------------------------------------------------------------
+
+
+def _write_sidecar(file_name: str, cache_dir: str, mtime_ns: int, size: int,
+                   index: Tuple[List[str], Dict[str, List[int]]]) -> None:
+    """
+
+    :param file_name: The absolute path of the keyword file
+    :param cache_dir: The directory in which the index is saved
+    :param mtime_ns: The modification time of the file in nanoseconds
+    :param size: The size of the file in bytes
+    :param index: The keyword index of the file
+
+    The index is written to a temporary file which then replaces the
+    saved index, so that other processes never read a partial file.  The
+    index is not saved if the directory can not be written to.
+    """
+    sidecar = _sidecar_name(file_name, cache_dir)
+    header = (_SIDECAR_VERSION, file_name, mtime_ns, size, _hash_file(file_name))
+    temp = '{}.{}.tmp'.format(sidecar, os.getpid())
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp, 'wb') as Output_File:
+            pickle.dump(header, Output_File, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(index, Output_File, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, sidecar)
+    except OSError:
+        if os.path.isfile(temp):
+            os.remove(temp)
+    return
+# ----------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=32)
+def _cached_keyword_index(file_name: str, mtime_ns: int, size: int,
+                          cache_dir: str = None) -> Tuple[List[str], Dict[str, List[int]]]:
+    """
+
+    :param file_name: The absolute path of the keyword file
+    :param mtime_ns: The modification time of the file in nanoseconds
+    :param size: The size of the file in bytes
+    :param cache_dir: The directory in which the index is saved, or None
+    :return index: The keyword index of the file
+
+    The modification time and size are only part of the cache key, so
+    that a file which has changed on disk is parsed again.
+    """
+    if cache_dir is None:
+        return _index_keyword_file(file_name)
+    index = _read_sidecar(file_name, cache_dir, mtime_ns, size)
+    if index is None:
+        index = _index_keyword_file(file_name)
+        _write_sidecar(file_name, cache_dir, mtime_ns, size, index)
+    return index
+# ----------------------------------------------------------------------------
+
+
+def _load_keyword_index(file_name: str,
+                        cache_dir: str = None) -> Tuple[List[str], Dict[str, List[int]]]:
+    """
+
+    :param file_name: The name of the file being read to include the
+                      path-link
+    :param cache_dir: The directory in which the index is saved, or None
+    :return index: The keyword index of the file
+
+    This function returns the keyword index of a file from the process-wide
+    cache, parsing the file only if it is not cached or has changed.
+    """
+    stats = os.stat(file_name)
+    if cache_dir is not None:
+        cache_dir = os.path.abspath(cache_dir)
+    return _cached_keyword_index(os.path.abspath(file_name),
+                                 stats.st_mtime_ns, stats.st_size, cache_dir)
+# ----------------------------------------------------------------------------
+
+
+def read_keyword_files(file_names: List[str], schema: Dict[str, str],
+                       processes: int = None, chunksize: int = 16) -> pd.DataFrame:
+    """
+
+    :param file_names: A list of keyword file names to include path-links
+    :param schema: A dictionary mapping each key word to the type of data
+                   that follows it.  Types are limited to those accepted by
+                   ``ReadTextFileKeywords.read_many``
+    :param processes: The number of worker processes.  Defaulted to None,
+                      in which case one process is used per CPU.  A value
+                      of 1 reads the files in the calling process
+    :param chunksize: The number of files sent to a worker process at a
+                      time.  Defaulted to 16
+    :return df: A pandas dataframe with one row per file, containing a
+                ``file`` column, a column for each key word and an
+                ``error`` column
+
+    This function reads the same key words from many text files, spreading
+    the files over a pool of processes.  A file that does not exist or
+    does not contain one of the key words does not stop the other files
+    from being read; instead the reason is written to the ``error`` column
+    of its row, which is empty for every file that was read successfully.
+    Assume a set of files titled ``case1.txt``, ``case2.txt`` and
+    ``case3.txt`` with contents similar to the following.
+
+    .. code-block:: text
+
+        velocity: 3.5
+        steps: 100
+
+    .. code-block:: python
+
+       > files = ['case1.txt', 'case2.txt', 'case3.txt']
+       > schema = {'velocity:': 'double', 'steps:': 'integer'}
+       > df = read_keyword_files(files, schema, processes=4)
+       > print(df)
+          file       velocity: steps: error
+       0  case1.txt  3.5       100    NaN
+       1  case2.txt  4.0       120    NaN
+       2  case3.txt  NaN       NaN    steps: Keywords not found in case3.txt
+    """
+    worker = partial(_read_keyword_file, schema=schema)
+    if processes == 1:
+        rows = [worker(file_name) for file_name in file_names]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            rows = list(executor.map(worker, file_names, chunksize=chunksize))
+    return pd.DataFrame.from_records(rows, columns=['file'] + list(schema) + ['error'])
+# ----------------------------------------------------------------------------
+
+
+def _read_keyword_file(file_name: str, schema: Dict[str, str]) -> Dict:
+    """
+
+    :param file_name: The name of the file being read to include the
+                      path-link
+    :param schema: A dictionary mapping each key word to the type of data
+                   that follows it
+    :return row: A dictionary containing the file name, the data read for
+                 each key word and the reason the file could not be read,
+                 if any
+    """
+    row = {'file': file_name, 'error': None}
+    try:
+        row.update(ReadTextFileKeywords(file_name).read_many(schema))
+    except SystemExit as error:
+        row['error'] = str(error)
+    except Exception as error:
+        row['error'] = '{}: {}'.format(type(error).__name__, error)
+    return row
+# ----------------------------------------------------------------------------
+
+
+def keyword_cache_info():
+    """
+
+    :return info: A named tuple containing the ``hits``, ``misses``,
+                  ``maxsize`` and ``currsize`` of the keyword file cache
+
+    Every ``ReadTextFileKeywords`` object in a process shares a cache of
+    the 32 most recently parsed keyword files.  The cache is keyed on the
+    absolute path, modification time and size of each file, so a new object
+    created on an unchanged file reuses the existing parse.  This function
+    can be used to confirm that the cache is being used.
+
+    .. code-block:: python
+
+       > dat = ReadTextFileKeywords('test_file.txt')
+       > dat.read_double('double:')
+       > dat = ReadTextFileKeywords('test_file.txt')
+       > dat.read_double('double:')
+       > print(keyword_cache_info())
+       CacheInfo(hits=1, misses=1, maxsize=32, currsize=1)
+    """
+    return _cached_keyword_index.cache_info()
+# ----------------------------------------------------------------------------
+
+
+def clear_keyword_cache() -> None:
+    """
+
+    This function empties the keyword file cache and resets its counters
+    """
+    _cached_keyword_index.cache_clear()
+    return
+# ================================================================================
+# ================================================================================
+
+
+class ColumnCache:
+    """
+
+    :param directory: The directory in which the cached columns are saved
+    :param max_bytes: The largest size of the cache in bytes.  Defaulted
+                      to 1 GB
+
+    This class saves the dataframes returned by the csv, text and excel
+    column reading functions in a columnar binary format, so that reading
+    the same columns of a file again loads them directly instead of parsing
+    the file.  Each cached
+    dataframe is saved as a ``.npy`` file per column, and numeric columns
+    are memory mapped when they are loaded.  A cached dataframe is keyed on
+    the absolute path, modification time and size of the file, together
+    with the columns, data types and other options passed to the reading
+    function, so a file that has changed on disk is parsed again.  When the
+    cache grows beyond **max_bytes** the least recently used dataframes are
+    removed.  Non-numeric columns are saved with ``pickle``, so the directory
+    should only be writable by trusted users.
+
+    .. code-block:: python
+
+       > cache = ColumnCache('/tmp/column_cache', max_bytes=10 * 2 ** 30)
+       > headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+       > dat = [int, str, float, int]
+       > # The first read parses the file and saves the columns
+       > df = read_csv_columns_by_headers('test.csv', headers, dat, cache=cache)
+       > # Later reads of the same columns load the saved columns
+       > df = read_csv_columns_by_headers('test.csv', headers, dat, cache=cache)
+    """
+    def __init__(self, directory: str, max_bytes: int = 2 ** 30):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+# ----------------------------------------------------------------------------
+
+    def read(self, file_name: str, options: Tuple, read_file) -> pd.DataFrame:
+        """
+
+        :param file_name: The file name to include path-link
+        :param options: A tuple containing the name of the reading function
+                        and every argument that affects the data it returns
+        :param read_file: A function without arguments that reads the file
+                          when the data is not in the cache
+        :return df: A pandas dataframe containing all relevant information
+        """
+        stats = os.stat(file_name)
+        key = repr((os.path.abspath(file_name), stats.st_mtime_ns, stats.st_size) +
+                   tuple(options))
+        entry = os.path.join(self.directory,
+                             hashlib.blake2b(key.encode(), digest_size=16).hexdigest())
+        df = self._load(entry)
+        if df is None:
+            df = read_file()
+            self._save(entry, df)
+            self._evict(entry)
+        return df
+# ----------------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """
+
+        This function removes every dataframe from the cache
+        """
+        for name in os.listdir(self.directory):
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        return
+# ----------------------------------------------------------------------------
+
+    def _load(self, entry: str) -> Union[pd.DataFrame, None]:
+        """
+
+        :param entry: The directory containing a cached dataframe
+        :return df: The cached dataframe, or None if it is not in the cache
+        """
+        try:
+            with open(os.path.join(entry, 'columns.json')) as Input_File:
+                columns = json.load(Input_File)
+            data = {}
+            for i, (name, data_type) in enumerate(columns):
+                column_file = os.path.join(entry, '{}.npy'.format(i))
+                if data_type is None:
+                    data[name] = np.load(column_file, mmap_mode='c').view(np.ndarray)
+                else:
+                    data[name] = pd.Series(np.load(column_file, allow_pickle=True),
+                                           dtype=object).astype(data_type)
+            os.utime(entry)
+        except Exception:
+            return None
+        return pd.DataFrame(data, columns=[name for name, _ in columns], copy=False)
+# ----------------------------------------------------------------------------
+
+    def _save(self, entry: str, df: pd.DataFrame) -> None:
+        """
+
+        :param entry: The directory in which the dataframe is saved
+        :param df: The dataframe to be saved
+
+        The columns are written to a temporary directory which is then
+        renamed, so that other processes never load a partial dataframe.
+        """
+        temp = tempfile.mkdtemp(dir=self.directory, prefix='.tmp')
+        columns = []
+        for i, name in enumerate(df.columns):
+            column = df[name]
+            column_file = os.path.join(temp, '{}.npy'.format(i))
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biufcmM':
+                np.save(column_file, column.to_numpy())
+                columns.append((name, None))
+            else:
+                np.save(column_file, column.to_numpy(dtype=object), allow_pickle=True)
+                columns.append((name, str(column.dtype)))
+        with open(os.path.join(temp, 'columns.json'), 'w') as Output_File:
+            json.dump(columns, Output_File)
+        try:
+            os.rename(temp, entry)
+        except OSError:
+            shutil.rmtree(temp, ignore_errors=True)
+        return
+# ----------------------------------------------------------------------------
+
+    def _evict(self, keep: str) -> None:
+        """
+
+        :param keep: The directory of a cached dataframe that is not removed
+
+        This function removes the least recently used dataframes until the
+        cache is no larger than ``max_bytes``.
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            entry = os.path.join(self.directory, name)
+            if name.startswith('.tmp') or not os.path.isdir(entry):
+                continue
+            size = sum(item.stat().st_size for item in os.scandir(entry))
+            entries.append((os.stat(entry).st_mtime_ns, size, entry))
+            total += size
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry != keep:
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+        return
 # ================================================================================
 # ================================================================================
 
 
 def read_csv_columns_by_headers(file_name: str, headers: List[str],
-                                data_type: List[type],
-                                skip: int = 0) -> pd.DataFrame:
+                                data_type: List[type], skip: int = 0,
+                                chunksize: int = None, processes: int = 1,
+                                cache: 'ColumnCache' = None, engine: str = None,
+                                compact: bool = False,
+                                where=None) -> Union[pd.DataFrame,
+                                                     Iterator[pd.DataFrame]]:
     """
 
     :param file_name: The file name to include path-link
@@ -340,7 +1121,43 @@ def read_csv_columns_by_headers(file_name: str, headers: List[str],
                       types are limited to ``numpy.int64``, ``numpy.float64``,
                       and ``str``
     :param skip: The number of lines to be skipped before reading data
-    :return df: A pandas dataframe containing all relevant information
+    :param chunksize: The number of rows in each dataframe returned by an
+                      iterator.  Defaulted to None, in which case the entire
+                      file is read into one dataframe
+    :param processes: The number of worker processes used to read the file.
+                      Defaulted to 1, in which case the file is read in the
+                      calling process.  A value of None uses one process
+                      per CPU.  This attribute is ignored when **chunksize**
+                      is used
+    :param cache: A ``ColumnCache`` object in which the dataframe is saved
+                  and from which it is loaded on later reads.  Defaulted
+                  to None, in which case the file is always parsed.  This
+                  attribute is ignored when **chunksize** is used
+    :param engine: The parser engine used by pandas, which can be ``c``,
+                   ``python`` or ``pyarrow``.  Defaulted to None, in which
+                   case pandas selects the engine.  The multithreaded
+                   ``pyarrow`` engine is replaced by the ``c`` engine when
+                   pyarrow is not installed or does not support the options
+                   used, such as **chunksize** or **where**
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False.  This
+                    attribute is ignored when **chunksize** is used
+    :param where: A condition that each row must meet to be returned, given
+                  either as a string such as ``'Number > 10'`` that is
+                  evaluated by ``pandas.DataFrame.eval``, or as a function that
+                  accepts a dataframe and returns a boolean array.  The
+                  condition is applied to each piece of the file as it is
+                  read, so the file is read in pieces even when **chunksize**
+                  is not used, and the ``pyarrow`` engine is replaced by the
+                  ``c`` engine unless more than one process is used.  A
+                  function must be defined at the top level of a module so
+                  that it can be sent to the worker processes when
+                  **processes** is not 1.  Defaulted to None, in which case
+                  every row is returned
+    :return df: A pandas dataframe containing all relevant information, or
+                an iterator of dataframes if **chunksize** is used
 
     This function assumes the file has a comma (i.e. ,) delimiter, if
     it does not, then it is not a true .csv file and should be transformed
@@ -437,18 +1254,91 @@ def read_csv_columns_by_headers(file_name: str, headers: List[str],
         1  2  t-shirt   1.8        3
         2  3  coffee    2.1        15
         3  4  books     3.2        40
+
+    Large files can be read in pieces with the `chunksize` attribute, in which
+    case only one piece of the file is held in memory at a time and each
+    piece can be processed as soon as it is read.
+
+    .. code-block:: python
+
+       > for df in read_csv_columns_by_headers(file_name, headers, dat,
+                                               skip=2, chunksize=2):
+       >     print(df)
+           ID Inventory Weight_per Number
+        0  1  shoes     1.5        5
+        1  2  t-shirt   1.8        3
+           ID Inventory Weight_per Number
+        2  3  coffee    2.1        15
+        3  4  books     3.2        40
+
+    A large file can be read by several processes at once with the
+    `processes` attribute.  The data below the header line is divided into
+    byte ranges that begin and end on a new line, each range is read by a
+    separate process, and the pieces are combined in their original order.
+    Fields must not contain quoted new line characters when this attribute
+    is used.
+
+    .. code-block:: python
+
+       > df = read_csv_columns_by_headers(file_name, headers, dat, skip=2,
+                                          processes=32)
+
+    Rows can be selected with the `where` attribute.  The file is read in
+    pieces and each piece is filtered as it is read, so the rows that do
+    not meet the condition are never held in memory together.  The rows
+    of the returned dataframe are numbered from 0, unless **chunksize** is
+    used, in which case each dataframe keeps the row numbers of the file.
+
+    .. code-block:: python
+
+       > df = read_csv_columns_by_headers(file_name, headers, dat, skip=2,
+                                          where='Number > 10')
+       > print(df)
+           ID Inventory Weight_per Number
+        0  3  coffee    2.1        15
+        1  4  books     3.2        40
+       > df = read_csv_columns_by_headers(file_name, headers, dat, skip=2,
+                                          where=lambda df: df['Inventory'].isin(['shoes']))
+       > print(df)
+           ID Inventory Weight_per Number
+        0  1  shoes     1.5        5
     """
     if not os.path.isfile(file_name):
         sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if cache is not None and chunksize is None:
+        df = cache.read(file_name, ('read_csv_columns_by_headers', headers,
+                                    data_type, skip),
+                        partial(read_csv_columns_by_headers, file_name, headers,
+                                data_type, skip, processes=processes,
+                                engine=engine))
+        if where is not None:
+            df = _filter_rows(df, where).reset_index(drop=True)
+        return compact_dataframe(df) if compact else df
     dat = dict(zip(headers, data_type))
-    df = pd.read_csv(file_name, usecols=headers, dtype=dat, skiprows=skip)
+    if processes != 1 and chunksize is None:
+        df = _read_byte_ranges(file_name, processes, skip, headers, dat,
+                               engine=engine, where=where)
+    elif where is not None:
+        df = _filter_chunks(_read_delimited(file_name, skip, engine, usecols=headers,
+                                            dtype=dat,
+                                            chunksize=chunksize or _WHERE_CHUNKSIZE),
+                            where, chunksize)
+    else:
+        df = _read_delimited(file_name, skip, engine, usecols=headers, dtype=dat,
+                             chunksize=chunksize)
+    if compact and chunksize is None:
+        df = compact_dataframe(df)
     return df
 # ----------------------------------------------------------------------------
 
 
 def read_csv_columns_by_index(file_name: str, col_index: List[int],
                               data_type: List[type], col_names: List[str],
-                              skip: int = 0) -> pd.DataFrame:
+                              skip: int = 0, chunksize: int = None,
+                              cache: 'ColumnCache' = None, engine: str = None,
+                              compact: bool = False,
+                              where=None) -> Union[pd.DataFrame,
+                                                   Iterator[pd.DataFrame]]:
     """
     :param file_name: The file name to include path-link
     :param col_index: A list of the columns to be read by number,
@@ -459,7 +1349,35 @@ def read_csv_columns_by_index(file_name: str, col_index: List[int],
     :param col_names: A list containing the names to be given to
                       each column
     :param skip: The number of lines to be skipped before reading data
-    :return df: A pandas dataframe containing all relevant information
+    :param chunksize: The number of rows in each dataframe returned by an
+                      iterator.  Defaulted to None, in which case the entire
+                      file is read into one dataframe
+    :param cache: A ``ColumnCache`` object in which the dataframe is saved
+                  and from which it is loaded on later reads.  Defaulted
+                  to None, in which case the file is always parsed.  This
+                  attribute is ignored when **chunksize** is used
+    :param engine: The parser engine used by pandas, which can be ``c``,
+                   ``python`` or ``pyarrow``.  Defaulted to None, in which
+                   case pandas selects the engine.  The multithreaded
+                   ``pyarrow`` engine is replaced by the ``c`` engine when
+                   pyarrow is not installed or does not support the options
+                   used, such as **chunksize** or **where**
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False.  This
+                    attribute is ignored when **chunksize** is used
+    :param where: A condition that each row must meet to be returned, given
+                  either as a string such as ``'Number > 10'`` that is
+                  evaluated by ``pandas.DataFrame.eval``, or as a function that
+                  accepts a dataframe and returns a boolean array.  The
+                  condition is applied to each piece of the file as it is
+                  read, so the file is read in pieces even when **chunksize**
+                  is not used, and the ``pyarrow`` engine is replaced by the
+                  ``c`` engine.  Defaulted to None, in which case every row is
+                  returned
+    :return df: A pandas dataframe containing all relevant information, or
+                an iterator of dataframes if **chunksize** is used
 
     This function assumes the file has a comma (i.e. ,) delimiter, if
     it does not, then it is not a true .csv file and should be transformed
@@ -535,35 +1453,554 @@ def read_csv_columns_by_index(file_name: str, col_index: List[int],
         - 3.2,
         - 48
 
-    This file can be read via the following command
+    This file can be read via the following command
+
+    .. code-block:: python
+
+       > file_name = 'test1.csv'
+       > headers = [0, 1, 2, 3]
+       > names = ['ID', 'Inventory', 'Weight_per', 'Number']
+       > dat = [int, str, float, int]
+       > df = read_csv_columns_by_index(file_name, headers,
+                                        dat, names, skip=2)
+       > print(df)
+           ID Inventory Weight_per Number
+        0  1  shoes     1.5        5
+        1  2  t-shirt   1.8        3
+        2  3  coffee    2.1        15
+        3  4  books     3.2        40
+
+    Large files can be read in pieces with the `chunksize` attribute, in which
+    case only one piece of the file is held in memory at a time and each
+    piece can be processed as soon as it is read.
+
+    .. code-block:: python
+
+       > for df in read_csv_columns_by_index(file_name, headers, dat, names,
+                                             skip=2, chunksize=2):
+       >     print(df)
+           ID Inventory Weight_per Number
+        0  1  shoes     1.5        5
+        1  2  t-shirt   1.8        3
+           ID Inventory Weight_per Number
+        2  3  coffee    2.1        15
+        3  4  books     3.2        40
+    """
+    if not os.path.isfile(file_name):
+        sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if cache is not None and chunksize is None:
+        df = cache.read(file_name, ('read_csv_columns_by_index', col_index,
+                                    data_type, col_names, skip),
+                        partial(read_csv_columns_by_index, file_name, col_index,
+                                data_type, col_names, skip, engine=engine))
+        if where is not None:
+            df = _filter_rows(df, where).reset_index(drop=True)
+        return compact_dataframe(df) if compact else df
+    dat = dict(zip(col_index, data_type))
+    if where is not None:
+        df = _filter_chunks(_read_delimited(file_name, skip, engine, usecols=col_index,
+                                            names=col_names, dtype=dat,
+                                            chunksize=chunksize or _WHERE_CHUNKSIZE),
+                            where, chunksize)
+    else:
+        df = _read_delimited(file_name, skip, engine, usecols=col_index,
+                             names=col_names, dtype=dat, chunksize=chunksize)
+    if compact and chunksize is None:
+        df = compact_dataframe(df)
+    return df
+# --------------------------------------------------------------------------------
+
+
+def _read_delimited(source, skip: int, engine: Union[str, None],
+                    **options) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+
+    :param source: The file name to include path-link, or a binary file
+                   object
+    :param skip: The number of lines to be skipped before reading data
+    :param engine: The parser engine requested by the user, or None
+    :param options: Keyword arguments passed to ``pandas.read_csv``, which
+                    must include ``usecols``
+    :return df: A pandas dataframe containing all relevant information, or
+                an iterator of dataframes if a ``chunksize`` is used
+
+    This function reads a delimited file with ``pandas.read_csv``.  The
+    ``pyarrow`` engine treats skipped lines, column names and the order of
+    the selected columns differently from the other engines, so when it is
+    used the skipped lines are read past before the file is handed to pandas,
+    and the columns are selected and named in the order they appear in the
+    file, matching the ``c`` engine.
+    """
+    engine = _csv_engine(engine, options.get('sep', ','), options.get('chunksize'))
+    if engine != 'pyarrow':
+        return pd.read_csv(source, skiprows=skip, engine=engine, **options)
+    options.pop('chunksize', None)
+    names = options.pop('names', None)
+    usecols = options.pop('usecols')
+    Input_File = open(source, 'rb') if isinstance(source, str) else source
+    try:
+        if names is not None:
+            for _ in range(skip):
+                Input_File.readline()
+            df = pd.read_csv(Input_File, header=None, usecols=sorted(usecols),
+                             engine=engine, **options)
+            df.columns = names
+            return df
+        header = _read_header_line(Input_File, skip)
+        Input_File.seek(Input_File.tell() - len(header))
+        columns = pd.read_csv(io.BytesIO(header), nrows=0,
+                              sep=options.get('sep', ',')).columns
+        usecols = [name for name in columns if name in usecols]
+        return pd.read_csv(Input_File, usecols=usecols, engine=engine, **options)
+    finally:
+        if Input_File is not source:
+            Input_File.close()
+# --------------------------------------------------------------------------------
+
+
+def _read_byte_ranges(file_name: str, processes: int, skip: int,
+                      headers: List[str], data_type: Dict, delimiter: str = ',',
+                      engine: str = None, where=None) -> pd.DataFrame:
+    """
+
+    :param file_name: The file name to include path-link
+    :param processes: The number of worker processes, or None for one
+                      process per CPU
+    :param skip: The number of lines to be skipped before the header line
+    :param headers: A list of the names of the headers that contain
+                    columns which will be read
+    :param data_type: A dictionary mapping each header to its data type
+    :param delimiter: The delimiter separating data in the file
+    :param engine: The parser engine requested by the user, or None
+    :param where: A condition applied to the rows of each range, or None
+    :return df: A pandas dataframe containing all relevant information
+
+    The header line is read in the same manner as the serial readers, and
+    the data below it is divided into one byte range per process.  Each
+    boundary is moved forward to the start of the next line so that no
+    line is divided between two ranges.  The ranges do not contain the
+    header line, so each process selects the columns by their position.
+    """
+    if processes is None:
+        processes = os.cpu_count()
+    names = list(pd.read_csv(file_name, skiprows=skip, nrows=0, sep=delimiter).columns)
+    with open(file_name, 'rb') as Input_File:
+        _read_header_line(Input_File, skip)
+        bounds = [Input_File.tell()]
+        size = os.fstat(Input_File.fileno()).st_size
+        for i in range(1, processes):
+            Input_File.seek(max(bounds[0] + (size - bounds[0]) * i // processes,
+                                bounds[-1]))
+            Input_File.readline()
+            bounds.append(min(Input_File.tell(), size))
+        bounds.append(size)
+    ranges = [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+    if len(ranges) == 0:
+        return _read_delimited(file_name, skip, engine, usecols=headers,
+                               dtype=data_type, sep=delimiter)
+    col_index = sorted(names.index(name) for name in headers)
+    worker = partial(_read_byte_range, file_name, engine=engine, where=where,
+                     usecols=col_index,
+                     names=[names[i] for i in col_index],
+                     dtype={i: data_type[names[i]] for i in col_index}, sep=delimiter)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        frames = list(executor.map(worker, ranges))
+    return _combine_frames(frames, [file_name] * len(frames))
+# --------------------------------------------------------------------------------
+
+
+def _read_header_line(Input_File, skip: int) -> bytes:
+    """
+
+    :param Input_File: A binary file object, positioned at its first byte
+    :param skip: The number of lines to be skipped before the header line
+    :return line: The header line, or an empty bytes object if the file
+                  ends before a header line.  The file is left positioned
+                  after the header line
+
+    The header line is found in the same manner as ``pandas.read_csv``,
+    which skips **skip** lines and then any blank lines.
+    """
+    for _ in range(skip):
+        Input_File.readline()
+    line = Input_File.readline()
+    while line and not line.strip():
+        line = Input_File.readline()
+    return line
+# --------------------------------------------------------------------------------
+
+
+def _read_byte_range(file_name: str, byte_range: Tuple[int, int],
+                     engine: str = None, where=None, **options) -> pd.DataFrame:
+    """
+
+    :param file_name: The file name to include path-link
+    :param byte_range: The first byte and one past the last byte to be read
+    :param engine: The parser engine requested by the user, or None
+    :param where: A condition that each row must meet to be returned, or None
+    :param options: Keyword arguments passed to ``pandas.read_csv``
+    :return df: A pandas dataframe containing the lines in **byte_range**
+    """
+    with open(file_name, 'rb') as Input_File:
+        Input_File.seek(byte_range[0])
+        data = Input_File.read(byte_range[1] - byte_range[0])
+    df = _read_bytes(data, engine, **options)
+    return df if where is None else _filter_rows(df, where)
+# --------------------------------------------------------------------------------
+
+
+def _read_bytes(data: bytes, engine: str = None, **options) -> pd.DataFrame:
+    """
+
+    :param data: Lines of a delimited file that do not include the header line
+    :param engine: The parser engine requested by the user, or None
+    :param options: Keyword arguments passed to ``pandas.read_csv``, which
+                    must select the columns by position and name them
+    :return df: A pandas dataframe containing the lines in **data**
+    """
+    if not data.strip():
+        return pd.DataFrame({name: pd.Series(dtype=options['dtype'][i]) for i, name
+                             in zip(options['usecols'], options['names'])})
+    if not data.endswith(b'\n'):
+        data += b'\n'
+    return _read_delimited(io.BytesIO(data), 0, engine, **options)
+# --------------------------------------------------------------------------------
+
+
+def _filter_chunks(chunks, where, chunksize: int = None) -> Union[pd.DataFrame,
+                                                                  Iterator[pd.DataFrame]]:
+    """
+
+    :param chunks: An iterator of dataframes returned by ``pandas.read_csv``
+    :param where: A condition that each row must meet to be returned
+    :param chunksize: The chunksize requested by the user, or None
+    :return df: An iterator of the filtered dataframes if **chunksize** is
+                used, otherwise one dataframe containing every row that
+                meets the condition
+
+    Each dataframe is filtered as soon as it is read, so that only the rows
+    that meet the condition are held in memory.
+    """
+    filtered = (_filter_rows(chunk, where) for chunk in chunks)
+    if chunksize is not None:
+        return filtered
+    with chunks:
+        return pd.concat(list(filtered), ignore_index=True)
+# --------------------------------------------------------------------------------
+
+
+def _filter_rows(df: pd.DataFrame, where) -> pd.DataFrame:
+    """
+
+    :param df: A pandas dataframe
+    :param where: A string evaluated by ``pandas.DataFrame.eval``, or a
+                  function that accepts a dataframe and returns a boolean
+                  array
+    :return df: The rows of **df** that meet the condition
+    """
+    mask = df.eval(where) if isinstance(where, str) else where(df)
+    return df[np.asarray(mask, dtype=bool)]
+# --------------------------------------------------------------------------------
+
+
+def available_csv_engines() -> List[str]:
+    """
+
+    :return engines: A list of the parser engines that can be passed to
+                     the csv and text reading functions in this environment
+
+    The ``c`` and ``python`` engines are always available, while the
+    ``pyarrow`` engine requires pyarrow and pandas 1.4 or later.
+
+    .. code-block:: python
+
+       > print(available_csv_engines())
+       ['c', 'python', 'pyarrow']
+    """
+    engines = ['c', 'python']
+    version = tuple(int(part) for part in pd.__version__.split('.')[:2])
+    if version >= (1, 4) and importlib.util.find_spec('pyarrow') is not None:
+        engines.append('pyarrow')
+    return engines
+# --------------------------------------------------------------------------------
+
+
+def _csv_engine(engine: Union[str, None], delimiter: str,
+                chunksize: int = None) -> Union[str, None]:
+    """
+
+    :param engine: The parser engine requested by the user, or None
+    :param delimiter: The delimiter passed to ``pandas.read_csv``
+    :param chunksize: The chunksize passed to ``pandas.read_csv``
+    :return engine: The requested engine, or ``c`` if the ``pyarrow``
+                    engine is not available or does not support the
+                    delimiter or chunksize
+    """
+    if engine != 'pyarrow':
+        return engine
+    if 'pyarrow' not in available_csv_engines() or len(delimiter) != 1 or \
+            chunksize is not None:
+        warnings.warn('The pyarrow engine can not be used, reading with the c engine')
+        return 'c'
+    return engine
+# --------------------------------------------------------------------------------
+
+
+def read_csv_files_by_headers(file_names: Union[str, List[str]], headers: List[str],
+                              data_type: List[type], skip: int = 0,
+                              processes: int = None, source_column: str = None,
+                              compact: bool = False, where=None) -> pd.DataFrame:
+    """
+
+    :param file_names: A list of file names to include path-links, or a
+                       glob pattern such as ``data/*.csv`` matching the files
+    :param headers: A list of the names of the headers that contain
+                    columns which will be read
+    :param data_type: A list containing the data type of each column.  Data
+                      types are limited to ``numpy.int64``, ``numpy.float64``,
+                      and ``str``
+    :param skip: The number of lines to be skipped before reading data
+    :param processes: The number of worker processes.  Defaulted to None,
+                      in which case one process is used per CPU.  A value
+                      of 1 reads the files in the calling process
+    :param source_column: The name of a column containing the name of the
+                          file each row was read from.  Defaulted to None,
+                          in which case the column is not added
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False
+    :param where: A condition that each row must meet to be returned, given
+                  either as a string such as ``'Number > 10'`` that is
+                  evaluated by ``pandas.DataFrame.eval``, or as a function that
+                  accepts a dataframe and returns a boolean array.  The
+                  condition is applied to each piece of the file as it is
+                  read.  The function must be defined at
+                  the top level of a module when more than one process is
+                  used.  Defaulted to None, in which case every row is returned
+    :return df: A pandas dataframe containing the rows of every file
+
+    This function reads the same columns from many .csv files that share a
+    format, such as the file ``test.csv`` described in the
+    ``read_csv_columns_by_headers`` function, spreading the files over a
+    pool of processes.  Rather than concatenating the dataframes of each
+    file, each numeric column is written into a single array sized for all
+    of the files, so that the combined dataframe does not need a second
+    copy of the data.  A glob pattern is expanded in alphabetical order.
+
+    .. code-block:: python
+
+       > headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+       > dat = [int, str, float, int]
+       > df = read_csv_files_by_headers('inventory_*.csv', headers, dat,
+                                        source_column='file')
+       > print(df)
+           ID Inventory Weight_per Number file
+        0  1  shoes     1.5        5      inventory_1.csv
+        1  2  t-shirt   1.8        3      inventory_1.csv
+        2  3  coffee    2.1        15     inventory_2.csv
+        3  4  books     3.2        40     inventory_2.csv
+    """
+    if isinstance(file_names, str):
+        file_names = sorted(glob.glob(file_names))
+    if len(file_names) == 0:
+        sys.exit('FATAL ERROR: No files to read')
+    for file_name in file_names:
+        if not os.path.isfile(file_name):
+            sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    worker = partial(read_csv_columns_by_headers, headers=headers,
+                     data_type=data_type, skip=skip, where=where)
+    if processes == 1:
+        frames = [worker(file_name) for file_name in file_names]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            frames = list(executor.map(worker, file_names))
+    df = _combine_frames(frames, file_names, source_column)
+    if compact:
+        df = compact_dataframe(df)
+    return df
+# --------------------------------------------------------------------------------
+
+
+def _combine_frames(frames: List[pd.DataFrame], file_names: List[str],
+                    source_column: str = None) -> pd.DataFrame:
+    """
+
+    :param frames: A list of dataframes with the same columns
+    :param file_names: The name of the file each dataframe was read from
+    :param source_column: The name of a column containing the file name of
+                          each row, or None
+    :return df: A single dataframe containing the rows of every dataframe
+
+    Numeric columns are copied into arrays allocated for every row at once,
+    and each dataframe is released once it has been copied, so that the
+    combined data and the individual dataframes are never both held in
+    memory in full.  Other columns are concatenated.
+    """
+    lengths = [len(frame) for frame in frames]
+    total = sum(lengths)
+    columns = {}
+    for name in frames[0].columns:
+        if isinstance(frames[0][name].dtype, np.dtype) and \
+                frames[0][name].dtype.kind in 'biuf':
+            columns[name] = np.empty(total, dtype=frames[0][name].dtype)
+        else:
+            columns[name] = []
+    start = 0
+    for i in range(len(frames)):
+        frame = frames[i]
+        frames[i] = None
+        for name, column in columns.items():
+            if isinstance(column, list):
+                column.append(frame[name])
+            else:
+                column[start:start + lengths[i]] = frame[name].to_numpy()
+        start += lengths[i]
+    for name, column in columns.items():
+        if isinstance(column, list):
+            columns[name] = pd.concat(column, ignore_index=True)
+    if source_column is not None:
+        codes, categories = pd.factorize(np.asarray(file_names))
+        columns[source_column] = pd.Categorical.from_codes(np.repeat(codes, lengths),
+                                                           categories=categories)
+    return pd.DataFrame(columns)
+# --------------------------------------------------------------------------------
+
+
+def compact_dataframe(df: pd.DataFrame, category_ratio: float = 0.5) -> pd.DataFrame:
+    """
+
+    :param df: A pandas dataframe
+    :param category_ratio: The largest ratio of unique values to rows for
+                           which a string column is stored as a category.
+                           Defaulted to 0.5
+    :return df: A pandas dataframe with the same values stored in less memory.
+                The number of bytes saved is stored in ``df.attrs['bytes_saved']``
+
+    Integer columns are stored in the smallest integer type of the same
+    signedness that holds their largest and smallest values, so that
+    arithmetic on a compacted column gives the same result, and floating
+    point columns are
+    stored as ``numpy.float32`` when every value is unchanged by the
+    conversion.  String columns with few unique values, such as the
+    ``Inventory`` column of the file ``test.csv`` described in the
+    ``read_csv_columns_by_headers`` function, are stored as categories,
+    where each row holds a small integer code rather than a string.
+    This function is used by the reading functions when ``compact=True``.
+
+    .. code-block:: python
+
+       > df = read_csv_columns_by_headers('inventory.csv', headers, dat,
+                                          compact=True)
+       > print(df.dtypes)
+        ID            int16
+        Inventory     category
+        Weight_per    float32
+        Number        int8
+       > print(df.attrs['bytes_saved'])
+        3471120
+    """
+    columns = {}
+    for name in df.columns:
+        column = df[name]
+        dtype = column.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iu' and len(column) > 0:
+            low, high = column.min(), column.max()
+            for narrow in _NARROW_INTEGERS[dtype.kind]:
+                if np.dtype(narrow).itemsize >= dtype.itemsize:
+                    break
+                if np.iinfo(narrow).min <= low and high <= np.iinfo(narrow).max:
+                    dtype = np.dtype(narrow)
+                    break
+        elif isinstance(dtype, np.dtype) and dtype.kind == 'f' and dtype.itemsize > 4:
+            values = column.to_numpy()
+            with np.errstate(over='ignore'):
+                narrow = values.astype(np.float32)
+            if np.array_equal(narrow, values, equal_nan=True):
+                dtype = np.float32
+        elif not isinstance(dtype, pd.CategoricalDtype) and \
+                pd.api.types.is_string_dtype(dtype) and \
+                column.nunique() <= category_ratio * len(column):
+            dtype = 'category'
+        columns[name] = column.astype(dtype) if dtype != column.dtype else column
+    compact = pd.DataFrame(columns, index=df.index)
+    compact.attrs['bytes_saved'] = int(df.memory_usage(deep=True).sum() -
+                                       compact.memory_usage(deep=True).sum())
+    return compact
+# --------------------------------------------------------------------------------
+
+
+def sample_csv_columns_by_headers(file_name: str, headers: List[str],
+                                  data_type: List[type], rows: int, skip: int = 0,
+                                  seed: int = 0, chunksize: int = 100000,
+                                  delimiter: str = ',',
+                                  engine: str = None) -> pd.DataFrame:
+    """
+
+    :param file_name: The file name to include path-link
+    :param headers: A list of the names of the headers that contain
+                    columns which will be read
+    :param data_type: A list containing the data type of each column.  Data
+                      types are limited to ``numpy.int64``, ``numpy.float64``,
+                      and ``str``
+    :param rows: The number of rows in the sample
+    :param skip: The number of lines to be skipped before reading data
+    :param seed: The seed of the random number generator, so that the same
+                 file and seed always return the same sample, whatever the
+                 **chunksize**.  Defaulted to 0
+    :param chunksize: The number of rows read from the file at a time.
+                      Defaulted to 100,000
+    :param delimiter: The delimiter separating data in the file.  Defaulted
+                      to a comma
+    :param engine: The parser engine used by pandas, as described in the
+                   ``read_csv_columns_by_headers`` function
+    :return df: A pandas dataframe containing a uniform random sample of
+                **rows** rows, or every row if the file contains fewer rows.
+                The rows are in the order they appear in the file, and each
+                keeps its row number in the file as its index
+
+    This function reads a file in pieces of **chunksize** rows and keeps a
+    random sample of the rows read so far, so that a sample can be drawn
+    from a file that is too large to be read into memory.  Each row is
+    given a random key and the **rows** rows with the smallest keys are
+    kept, so every row of the file is equally likely to be in the sample,
+    and no more than **rows** plus **chunksize** rows are held in memory.
 
     .. code-block:: python
 
-       > file_name = 'test1.csv'
-       > headers = [0, 1, 2, 3]
-       > names = ['ID', 'Inventory', 'Weight_per', 'Number']
+       > headers = ['ID', 'Inventory', 'Weight_per', 'Number']
        > dat = [int, str, float, int]
-       > df = read_csv_columns_by_index(file_name, headers,
-                                        dat, names, skip=2)
+       > df = sample_csv_columns_by_headers('inventory.csv', headers, dat, 3)
        > print(df)
-           ID Inventory Weight_per Number
-        0  1  shoes     1.5        5
-        1  2  t-shirt   1.8        3
-        2  3  coffee    2.1        15
-        3  4  books     3.2        40
+                ID  Inventory Weight_per Number
+        18341   18342  coffee    2.1        15
+        503712  503713  shoes    1.5        5
+        934457  934458  books    3.2        40
     """
     if not os.path.isfile(file_name):
         sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
-    dat = dict(zip(col_index, data_type))
-    df = pd.read_csv(file_name, usecols=col_index, names=col_names, dtype=dat,
-                     skiprows=skip)
-    return df
+    generator = np.random.default_rng(seed)
+    sample = None
+    keys = np.empty(0)
+    dat = dict(zip(headers, data_type))
+    with _read_delimited(file_name, skip, engine, usecols=headers, dtype=dat,
+                         sep=delimiter, chunksize=chunksize) as chunks:
+        for chunk in chunks:
+            sample = chunk if sample is None else pd.concat([sample, chunk])
+            keys = np.concatenate([keys, generator.random(len(chunk))])
+            if len(keys) > rows:
+                keep = np.argpartition(keys, rows)[:rows] if rows > 0 else []
+                sample = sample.iloc[keep]
+                keys = keys[keep]
+    return sample.sort_index()
 # --------------------------------------------------------------------------------
 
 
 def read_text_columns_by_headers(file_name: str, headers: List[str],
-                                 data_type: List[type],
-                                 skip: int = 0, delimiter=r"\s+") -> pd.DataFrame:
+                                 data_type: List[type], skip: int = 0,
+                                 delimiter=r"\s+", processes: int = 1,
+                                 cache: 'ColumnCache' = None, engine: str = None,
+                                 compact: bool = False) -> pd.DataFrame:
     """
 
     :param file_name: The file name to include path-link
@@ -578,6 +2015,24 @@ def read_text_columns_by_headers(file_name: str, headers: List[str],
                 more white spaces.  This function can use any delimiter,
                 to include a comma separation; however, a comma delimiter
                 should be a .csv file extension.
+    :param processes: The number of worker processes used to read the file.
+                      Defaulted to 1, in which case the file is read in the
+                      calling process.  A value of None uses one process
+                      per CPU
+    :param cache: A ``ColumnCache`` object in which the dataframe is saved
+                  and from which it is loaded on later reads.  Defaulted
+                  to None, in which case the file is always parsed
+    :param engine: The parser engine used by pandas, which can be ``c``,
+                   ``python`` or ``pyarrow``.  Defaulted to None, in which
+                   case pandas selects the engine.  The multithreaded
+                   ``pyarrow`` engine is replaced by the ``c`` engine when
+                   pyarrow is not installed or does not support the options
+                   used, such as a
+                   **delimiter** longer than one character
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False
     :return df: A pandas dataframe containing all relevant information
 
     This function assumes the file has a space delimiter, if
@@ -675,19 +2130,46 @@ def read_text_columns_by_headers(file_name: str, headers: List[str],
         1  2  t-shirt   1.8        3
         2  3  coffee    2.1        15
         3  4  books     3.2        40
+
+    A large file can be read by several processes at once with the
+    `processes` attribute.  The data below the header line is divided into
+    byte ranges that begin and end on a new line, each range is read by a
+    separate process, and the pieces are combined in their original order.
+    Fields must not contain quoted new line characters when this attribute
+    is used.
+
+    .. code-block:: python
+
+       > df = read_text_columns_by_headers(file_name, headers, dat, skip=2,
+                                           processes=32)
     """
     if not os.path.isfile(file_name):
         sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if cache is not None:
+        df = cache.read(file_name, ('read_text_columns_by_headers', headers,
+                                    data_type, skip, delimiter),
+                        partial(read_text_columns_by_headers, file_name, headers,
+                                data_type, skip, delimiter, processes,
+                                engine=engine))
+        return compact_dataframe(df) if compact else df
     dat = dict(zip(headers, data_type))
-    df = pd.read_csv(file_name, usecols=headers, dtype=dat, skiprows=skip,
-                     sep=delimiter)
+    if processes != 1:
+        df = _read_byte_ranges(file_name, processes, skip, headers, dat,
+                               delimiter, engine)
+    else:
+        df = _read_delimited(file_name, skip, engine, usecols=headers, dtype=dat,
+                             sep=delimiter)
+    if compact:
+        df = compact_dataframe(df)
     return df
 # --------------------------------------------------------------------------------
 
 
 def read_text_columns_by_index(file_name: str, col_index: List[int],
                                data_type: List[type], col_names: List[str],
-                               skip: int = 0, delimiter=r"\s+") -> pd.DataFrame:
+                               skip: int = 0, delimiter=r"\s+",
+                               cache: 'ColumnCache' = None, engine: str = None,
+                               compact: bool = False) -> pd.DataFrame:
     """
 
     :param file_name: The file name to include path-link
@@ -704,6 +2186,20 @@ def read_text_columns_by_index(file_name: str, col_index: List[int],
                 more white spaces.  This function can use any delimiter,
                 to include a comma separation; however, a comma delimiter
                 should be a .csv file extension.
+    :param cache: A ``ColumnCache`` object in which the dataframe is saved
+                  and from which it is loaded on later reads.  Defaulted
+                  to None, in which case the file is always parsed
+    :param engine: The parser engine used by pandas, which can be ``c``,
+                   ``python`` or ``pyarrow``.  Defaulted to None, in which
+                   case pandas selects the engine.  The multithreaded
+                   ``pyarrow`` engine is replaced by the ``c`` engine when
+                   pyarrow is not installed or does not support the options
+                   used, such as a
+                   **delimiter** longer than one character
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False
     :return df: A pandas dataframe containing all relevant information
 
     Assume we have a .txt file titled ``test.txt`` with the following format.
@@ -801,27 +2297,419 @@ def read_text_columns_by_index(file_name: str, col_index: List[int],
     """
     if not os.path.isfile(file_name):
         sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if cache is not None:
+        df = cache.read(file_name, ('read_text_columns_by_index', col_index,
+                                    data_type, col_names, skip, delimiter),
+                        partial(read_text_columns_by_index, file_name, col_index,
+                                data_type, col_names, skip, delimiter,
+                                engine=engine))
+        return compact_dataframe(df) if compact else df
     dat = dict(zip(col_index, data_type))
-    df = pd.read_csv(file_name, usecols=col_index, names=col_names, dtype=dat,
-                     skiprows=skip, sep=delimiter)
+    df = _read_delimited(file_name, skip, engine, usecols=col_index,
+                         names=col_names, dtype=dat, sep=delimiter)
+    if compact:
+        df = compact_dataframe(df)
     return df
 # ----------------------------------------------------------------------------
 
 
-def read_excel_columns_by_headers(file_name: str, tab: str, headers: List[str],
-                                  data_type: List[type], skip: int = 0) -> pd.DataFrame:
+def read_text_columns_by_span(file_name: str, col_spans: List[Tuple[int, int]],
+                              data_type: List[type], col_names: List[str],
+                              skip: int = 0,
+                              chunksize: int = None) -> Union[pd.DataFrame,
+                                                              Iterator[pd.DataFrame]]:
+    """
+
+    :param file_name: The file name to include path-link
+    :param col_spans: A list containing the first byte and one past the last
+                      byte of each column in a line, starting with byte 0
+                      as the first byte of the line
+    :param data_type: A list containing the data type of each column.  Data
+                      types are limited to ``numpy.int64``, ``numpy.float64``,
+                      and ``str``
+    :param col_names: A list containing the names to be given to
+                      each column
+    :param skip: The number of lines to be skipped before reading data
+    :param chunksize: The number of rows in each dataframe returned by an
+                      iterator.  Defaulted to None, in which case the entire
+                      file is read into one dataframe
+    :return df: A pandas dataframe containing all relevant information, or
+                an iterator of dataframes if **chunksize** is used
+
+    This function reads a file in which each column occupies the same bytes
+    of every line, such as the output of a Fortran program, without
+    splitting each line on a delimiter.  The lines are copied into a single
+    array of bytes, each column is sliced from the array, and numeric
+    columns are converted directly into NumPy arrays.  Blank lines are
+    ignored, blank floating point fields are read as ``NaN``, and floating
+    point numbers written with a Fortran ``D`` exponent are read correctly.
+    Assume we have a .txt file titled ``test.txt`` with the following format.
+
+    .. code-block:: text
+
+       Inventory written by program X
+       ID  Inventory   Weight_per  Number
+        1  shoes       1.500D+00        5
+        2  t-shirt     1.800D+00        3
+        3  coffee      2.100D+00       15
+        4  books       3.200D+00       40
+
+    This file can be read via the following command
+
+    .. code-block:: python
+
+       > file_name = 'test.txt'
+       > spans = [(0, 3), (4, 16), (16, 25), (25, 34)]
+       > names = ['ID', 'Inventory', 'Weight_per', 'Number']
+       > dat = [int, str, float, int]
+       > df = read_text_columns_by_span(file_name, spans, dat, names, skip=2)
+       > print(df)
+           ID Inventory Weight_per Number
+        0  1  shoes     1.5        5
+        1  2  t-shirt   1.8        3
+        2  3  coffee    2.1        15
+        3  4  books     3.2        40
+    """
+    if not os.path.isfile(file_name):
+        sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if chunksize is not None:
+        return _fixed_width_chunks(file_name, col_spans, data_type, col_names,
+                                   skip, chunksize)
+    with open(file_name, 'rb') as Input_File:
+        for _ in range(skip):
+            Input_File.readline()
+        lines = Input_File.read().splitlines()
+    return _parse_fixed_width(lines, col_spans, data_type, col_names)
+# --------------------------------------------------------------------------------
+
+
+def _fixed_width_chunks(file_name: str, col_spans: List[Tuple[int, int]],
+                        data_type: List[type], col_names: List[str], skip: int,
+                        chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+
+    :param file_name: The file name to include path-link
+    :param col_spans: A list containing the first byte and one past the last
+                      byte of each column
+    :param data_type: A list containing the data type of each column
+    :param col_names: A list containing the names to be given to each column
+    :param skip: The number of lines to be skipped before reading data
+    :param chunksize: The number of rows in each dataframe, not counting
+                      blank lines
+    :return df: An iterator of dataframes, each indexed by the position of
+                its rows in the file
+    """
+    with open(file_name, 'rb') as Input_File:
+        for _ in range(skip):
+            Input_File.readline()
+        start = 0
+        while True:
+            rows = (line.rstrip(b'\r\n') for line in Input_File if line.strip())
+            lines = list(itertools.islice(rows, chunksize))
+            if len(lines) == 0:
+                return
+            df = _parse_fixed_width(lines, col_spans, data_type, col_names)
+            df.index = pd.RangeIndex(start, start + len(df))
+            start += len(df)
+            yield df
+# --------------------------------------------------------------------------------
+
+
+def _parse_fixed_width(lines: List[bytes], col_spans: List[Tuple[int, int]],
+                       data_type: List[type], col_names: List[str]) -> pd.DataFrame:
+    """
+
+    :param lines: The lines to be read, without new line characters
+    :param col_spans: A list containing the first byte and one past the last
+                      byte of each column
+    :param data_type: A list containing the data type of each column
+    :param col_names: A list containing the names to be given to each column
+    :return df: A pandas dataframe containing the columns of every line
+
+    The lines are copied into a two dimensional array with one byte per
+    element, padded at the end of short lines, so that each column is a
+    slice of the array that NumPy converts to numbers without a Python loop.
+    """
+    lines = [line for line in lines if line.strip()]
+    width = max([end for _, end in col_spans] + [1])
+    matrix = np.array(lines, dtype='S{}'.format(width)).view(np.uint8)
+    matrix = matrix.reshape(len(lines), width)
+    columns = {}
+    for (start, end), dat, name in zip(col_spans, data_type, col_names):
+        field = np.ascontiguousarray(matrix[:, start:end]).view('S{}'.format(end - start))
+        field = field.reshape(len(lines))
+        if dat is str:
+            columns[name] = np.char.strip(np.char.decode(field, 'utf-8'))
+            continue
+        try:
+            columns[name] = field.astype(dat)
+        except ValueError:
+            if np.dtype(dat).kind != 'f':
+                sys.exit('{}{}{}'.format('FATAL ERROR: ', name,
+                                         ' contains a value that is not an integer'))
+            field = np.char.replace(np.char.replace(field, b'D', b'E'), b'd', b'e')
+            field = field.astype('S{}'.format(max(end - start, 3)))
+            field[np.char.strip(field) == b''] = b'nan'
+            columns[name] = field.astype(dat)
+    return pd.DataFrame(columns, columns=col_names)
+# --------------------------------------------------------------------------------
+
+
+def read_numeric_columns_by_index(file_name: str, col_index: List[int],
+                                  data_type: Union[type, List[type]] = np.float64,
+                                  col_names: List[str] = None, skip: int = 0,
+                                  delimiter: str = None,
+                                  as_array: bool = False) -> Union[Dict[str, np.ndarray],
+                                                                   np.ndarray]:
+    """
+
+    :param file_name: The file name to include path-link
+    :param col_index: A list of the columns to be read by number,
+                      starting with column 0 as the far left column
+    :param data_type: The numeric data type of every column, or a list
+                      containing the data type of each column.  Defaulted to
+                      ``numpy.float64``
+    :param col_names: A list containing the names to be given to each
+                      column.  Defaulted to None, in which case each column
+                      is named by its number
+    :param skip: The number of lines to be skipped before reading data
+    :param delimiter: The delimiter separating data in the file.  Defaulted
+                      to None, in which case columns are separated by one or
+                      more white spaces.  A .csv file is read with ``','``
+    :param as_array: True if the columns are returned as the columns of a
+                     single two dimensional array, in which case every column
+                     must have the same data type.  Defaulted to False
+    :return data: A dictionary mapping each column name to a NumPy array, or
+                  a two dimensional NumPy array if **as_array** is True
+
+    This function reads columns that contain only numbers directly into
+    NumPy arrays with ``numpy.loadtxt``, without building a pandas dataframe,
+    for data that is passed directly to numerical code.  The arrays in the
+    dictionary are views of the single array read from the file, so no data
+    is copied after the file is read.  Assume we have a .txt file titled
+    ``test.txt`` with the following format.
+
+    .. list-table:: test.txt
+      :widths: 6 10 6 6
+      :header-rows: 0
+
+      * - 1
+        - Shoes
+        - 1.5
+        - 5
+      * - 2
+        - t-shirt
+        - 1.8
+        - 3
+      * - 3
+        - coffee
+        - 2.1
+        - 15
+      * - 4
+        - books
+        - 3.2
+        - 48
+
+    The numeric columns can be read via the following commands
+
+    .. code-block:: python
+
+       > data = read_numeric_columns_by_index('test.txt', [0, 2, 3],
+                                              [np.int64, np.float64, np.int64],
+                                              ['ID', 'Weight_per', 'Number'])
+       > print(data)
+        {'ID': array([1, 2, 3, 4]), 'Weight_per': array([1.5, 1.8, 2.1, 3.2]),
+         'Number': array([5, 3, 15, 48])}
+       > data = read_numeric_columns_by_index('test.txt', [2, 3], as_array=True)
+       > print(data)
+        [[ 1.5  5. ]
+         [ 1.8  3. ]
+         [ 2.1 15. ]
+         [ 3.2 48. ]]
+    """
+    if not os.path.isfile(file_name):
+        sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if col_names is None:
+        col_names = list(col_index)
+    if not isinstance(data_type, (list, tuple)):
+        data_type = [data_type] * len(col_index)
+    options = {'usecols': col_index, 'skiprows': skip, 'delimiter': delimiter,
+               'comments': None, 'ndmin': 2}
+    if len(set(np.dtype(dat) for dat in data_type)) == 1:
+        block = np.loadtxt(file_name, dtype=data_type[0], **options)
+        return block if as_array else dict(zip(col_names, block.T))
+    if as_array:
+        sys.exit('FATAL ERROR: as_array requires every column to have the same data type')
+    dtype = [('f{}'.format(i), dat) for i, dat in enumerate(data_type)]
+    records = np.loadtxt(file_name, dtype=dtype, **options).ravel()
+    return {name: records['f{}'.format(i)] for i, name in enumerate(col_names)}
+# --------------------------------------------------------------------------------
+
+
+class TailColumnReader:
+    """
+
+    :param file_name: The file name to include path-link
+    :param headers: A list of the names of the headers that contain
+                    columns which will be read
+    :param data_type: A list containing the data type of each column.  Data
+                      types are limited to ``numpy.int64``, ``numpy.float64``,
+                      and ``str``
+    :param skip: The number of lines to be skipped before the header line
+    :param delimiter: The delimiter separating data in the file.  Defaulted
+                      to a comma.  A text file delimited by one or more white
+                      spaces can be read with ``r"\\s+"``
+    :param engine: The parser engine used by pandas, as described in the
+                   ``read_csv_columns_by_headers`` function
+
+    This class reads a file that is written to by appending lines, such as
+    a log of measurements, each time new lines are added.  The first call
+    to ``read`` reads the header line and every complete line below it, and
+    each later call reads only the complete lines appended since the last
+    call, starting from the byte offset saved in the ``offset`` attribute.
+    A line that has not yet been ended with a new line character is read by
+    the next call.  If the file becomes smaller than the saved offset, or is
+    replaced by a new file with the same name, as happens when a log file is
+    rotated, the header line of the new file is read and the file is read
+    from its first line.  Fields must not contain quoted new line characters.
+
+    .. code-block:: python
+
+       > tail = TailColumnReader('telemetry.csv', ['Time', 'Temperature'],
+                                 [np.float64, np.float64])
+       > df = tail.read()
+       > print(df)
+           Time  Temperature
+        0  0.0   21.5
+        1  1.0   21.6
+       > # Later, after more lines are written to the file
+       > df = tail.read()
+       > print(df)
+           Time  Temperature
+        0  2.0   21.8
+    """
+    def __init__(self, file_name: str, headers: List[str], data_type: List[type],
+                 skip: int = 0, delimiter: str = ',', engine: str = None):
+        if not os.path.isfile(file_name):
+            sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+        self.file_name = file_name
+        self.headers = headers
+        self.data_type = data_type
+        self.skip = skip
+        self.delimiter = delimiter
+        self.engine = engine
+        self.offset = None
+        self.inode = None
+        self._options = None
+# ----------------------------------------------------------------------------
+
+    def read(self) -> pd.DataFrame:
+        """
+
+        :return df: A pandas dataframe containing the complete lines appended
+                    to the file since the last call.  The dataframe has no
+                    rows if no lines have been appended, or if the file does
+                    not exist while it is being rotated
+        """
+        try:
+            Input_File = open(self.file_name, 'rb')
+        except FileNotFoundError:
+            self.offset = None
+            return self._empty()
+        with Input_File:
+            stats = os.fstat(Input_File.fileno())
+            if stats.st_ino != self.inode or \
+                    (self.offset is not None and stats.st_size < self.offset):
+                self.offset = None
+                self.inode = stats.st_ino
+            if self.offset is None and not self._read_header(Input_File):
+                return self._empty()
+            Input_File.seek(self.offset)
+            data = Input_File.read(stats.st_size - self.offset)
+        data = data[:data.rfind(b'\n') + 1]
+        self.offset += len(data)
+        return _read_bytes(data, self.engine, **self._options)
+# ----------------------------------------------------------------------------
+
+    def _read_header(self, Input_File) -> bool:
+        """
+
+        :param Input_File: The file object, positioned at its first byte
+        :return status: True if the header line has been read, False if the
+                        file does not yet contain a complete header line
+
+        The columns are selected by their position in the header line, since
+        the lines read by later calls do not include the header line.
+        """
+        line = _read_header_line(Input_File, self.skip)
+        if not line.endswith(b'\n'):
+            return False
+        names = list(pd.read_csv(io.BytesIO(line), nrows=0, sep=self.delimiter).columns)
+        for name in self.headers:
+            if name not in names:
+                sys.exit('{}{}{}{}'.format('FATAL ERROR: ', name, ' not found in ',
+                                           self.file_name))
+        dat = dict(zip(self.headers, self.data_type))
+        col_index = sorted(names.index(name) for name in self.headers)
+        self._options = {'usecols': col_index, 'names': [names[i] for i in col_index],
+                         'dtype': {i: dat[names[i]] for i in col_index},
+                         'sep': self.delimiter}
+        self.offset = Input_File.tell()
+        return True
+# ----------------------------------------------------------------------------
+
+    def _empty(self) -> pd.DataFrame:
+        """
+
+        :return df: A pandas dataframe with the requested columns and no rows
+        """
+        if self._options is not None:
+            return _read_bytes(b'', **self._options)
+        return pd.DataFrame({name: pd.Series(dtype=data_type) for name, data_type
+                             in zip(self.headers, self.data_type)})
+# --------------------------------------------------------------------------------
+
+
+def read_excel_columns_by_headers(file_name: Union[str, pd.ExcelFile],
+                                  tab: Union[str, List[str]], headers: List[str],
+                                  data_type: List[type], skip: int = 0,
+                                  compact: bool = False, cache: 'ColumnCache' = None,
+                                  chunksize: int = None) -> Union[pd.DataFrame,
+                                                                  Dict[str, pd.DataFrame],
+                                                                  Iterator[pd.DataFrame]]:
     """
 
     :param file_name: The file name to include path-link.  Must be an
-                      .xls file format.  This code will **not** read .xlsx
-    :param tab: The tab or sheet name that data will be read from
+                      .xls file format.  This code will **not** read .xlsx.
+                      A ``pandas.ExcelFile`` object can be passed in place of
+                      the file name, so that a workbook that is already open
+                      is not opened again
+    :param tab: The tab or sheet name that data will be read from, or a list
+                of tab names that are read from the workbook after it is
+                opened once
     :param headers: A list of the names of the headers that contain
                     columns which will be read
     :param data_type: A list containing the data type of each column.  Data
                       types are limited to ``numpy.int64``, ``numpy.float64``,
                       and ``str``
     :param skip: The number of lines to be skipped before reading data
-    :return df: A pandas dataframe containing all relevant information
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False
+    :param cache: A ``ColumnCache`` object in which each tab is saved and
+                  from which it is loaded on later reads, until the workbook
+                  is modified.  Defaulted to None, in which case the workbook
+                  is always parsed.  This attribute is ignored when a
+                  ``pandas.ExcelFile`` object is passed
+    :param chunksize: The number of rows in each dataframe returned by an
+                      iterator.  Defaulted to None, in which case the entire
+                      tab is read into one dataframe.  **tab** must be a
+                      single tab name when this attribute is used, and the
+                      **compact** and **cache** attributes are ignored
+    :return df: A pandas dataframe containing all relevant information, a
+                dictionary mapping each tab name to a dataframe if **tab** is
+                a list, or an iterator of dataframes if **chunksize** is used
 
     Assume we have a .xls file titled ``test.xls`` with the following format
     in a tab titled ``primary``.
@@ -919,24 +2807,111 @@ def read_excel_columns_by_headers(file_name: str, tab: str, headers: List[str],
         1  2  t-shirt   1.8        3
         2  3  coffee    2.1        15
         3  4  books     3.2        40
+
+    Opening a workbook parses the whole file, so several tabs should be read
+    with one call, or from a ``pandas.ExcelFile`` object that is opened once
+    and passed to each call.
+
+    .. code-block:: python
+
+       > dfs = read_excel_columns_by_headers(file_name, ['primary', 'secondary'],
+                                             headers, dat, skip=2)
+       > print(dfs['secondary'])
+           ID Inventory  Weight_per Number
+        0  5  shelves    15.4       4
+        1  6  computers  3.4        10
+        2  7  mugs       0.6        20
+       > with pd.ExcelFile(file_name) as workbook:
+       >     ids = read_excel_columns_by_headers(workbook, 'primary', ['ID'],
+                                                 [int], skip=2)
+       >     weights = read_excel_columns_by_headers(workbook, 'primary',
+                                                     ['Weight_per'], [float],
+                                                     skip=2)
+
+    Workbooks that rarely change can be read with a ``ColumnCache`` object,
+    in which case the selected columns of each tab are saved in a columnar
+    format after the workbook is first parsed, and later reads of the same
+    tab and columns load them without parsing the workbook until its
+    modification time or size changes.  When a list of tabs is read with a
+    cache, the tabs in the cache are loaded without opening the workbook,
+    and the workbook is opened once to read the tabs that are not.
+
+    .. code-block:: python
+
+       > cache = ColumnCache('/tmp/column_cache')
+       > df = read_excel_columns_by_headers(file_name, tab, headers, dat,
+                                            skip=2, cache=cache)
+
+    A tab with many rows can be read in pieces with the `chunksize`
+    attribute.  The cells of the tab are read with xlrd and each piece is
+    converted to a dataframe only when the iterator reaches it, so the
+    dataframe of the full tab is never built and each piece can be
+    processed before the next is converted.  The .xls format does not
+    allow a tab to be parsed in pieces, so the cells of the tab are held
+    in memory while the iterator is used.
+
+    .. code-block:: python
+
+       > for df in read_excel_columns_by_headers(file_name, tab, headers, dat,
+                                                 skip=2, chunksize=2):
+       >     print(df)
+           ID Inventory Weight_per Number
+        0  1  shoes     1.5        5
+        1  2  t-shirt   1.8        3
+           ID Inventory Weight_per Number
+        2  3  coffee    2.1        15
+        3  4  books     3.2        40
     """
-    if not os.path.isfile(file_name):
+    if not isinstance(file_name, pd.ExcelFile) and not os.path.isfile(file_name):
         sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if chunksize is not None:
+        return _excel_chunks(file_name, tab, headers, data_type, skip, chunksize)
+    if isinstance(file_name, pd.ExcelFile):
+        cache = None
+    if isinstance(tab, list) and cache is not None:
+        return _read_cached_tabs(file_name, tab, ('read_excel_columns_by_headers',
+                                                  headers, data_type, skip),
+                                 partial(read_excel_columns_by_headers, headers=headers,
+                                         data_type=data_type, skip=skip),
+                                 compact, cache)
+    if isinstance(tab, list):
+        with _open_workbook(file_name) as workbook:
+            return {name: read_excel_columns_by_headers(workbook, name, headers,
+                                                        data_type, skip, compact)
+                    for name in tab}
+    if cache is not None:
+        df = cache.read(file_name, ('read_excel_columns_by_headers', tab, headers,
+                                    data_type, skip),
+                        partial(read_excel_columns_by_headers, file_name, tab,
+                                headers, data_type, skip))
+        return compact_dataframe(df) if compact else df
     dat = dict(zip(headers, data_type))
     df = pd.read_excel(file_name, sheet_name=tab, usecols=headers,
                        dtype=dat, skiprows=skip)
+    if compact:
+        df = compact_dataframe(df)
     return df
 # ----------------------------------------------------------------------------
 
 
-def read_excel_columns_by_index(file_name: str, tab: str, col_index: List[int],
+def read_excel_columns_by_index(file_name: Union[str, pd.ExcelFile],
+                                tab: Union[str, List[str]], col_index: List[int],
                                 col_names: List[str], data_type: List[type],
-                                skip: int = 0) -> pd.DataFrame:
+                                skip: int = 0, compact: bool = False,
+                                cache: 'ColumnCache' = None,
+                                chunksize: int = None) -> Union[pd.DataFrame,
+                                                                Dict[str, pd.DataFrame],
+                                                                Iterator[pd.DataFrame]]:
     """
 
     :param file_name: The file name to include path-link.  Must be an
-                      .xls file format.  This code will **not** read .xlsx
-    :param tab: The tab or sheet name that data will be read from
+                      .xls file format.  This code will **not** read .xlsx.
+                      A ``pandas.ExcelFile`` object can be passed in place of
+                      the file name, so that a workbook that is already open
+                      is not opened again
+    :param tab: The tab or sheet name that data will be read from, or a list
+                of tab names that are read from the workbook after it is
+                opened once
     :param col_index: A list of the columns to be read by number,
                       starting with column 0 as the far left column
     :param col_names: A list containing the names to be given to
@@ -945,7 +2920,23 @@ def read_excel_columns_by_index(file_name: str, tab: str, col_index: List[int],
                       types are limited to ``numpy.int64``, ``numpy.float64``,
                       and ``str``
     :param skip: The number of lines to be skipped before reading data
-    :return df: A pandas dataframe containing all relevant information
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False
+    :param cache: A ``ColumnCache`` object in which each tab is saved and
+                  from which it is loaded on later reads, until the workbook
+                  is modified.  Defaulted to None, in which case the workbook
+                  is always parsed.  This attribute is ignored when a
+                  ``pandas.ExcelFile`` object is passed
+    :param chunksize: The number of rows in each dataframe returned by an
+                      iterator.  Defaulted to None, in which case the entire
+                      tab is read into one dataframe.  **tab** must be a
+                      single tab name when this attribute is used, and the
+                      **compact** and **cache** attributes are ignored
+    :return df: A pandas dataframe containing all relevant information, a
+                dictionary mapping each tab name to a dataframe if **tab** is
+                a list, or an iterator of dataframes if **chunksize** is used
 
     Assume we have a .txt file titled ``test.xls`` with the following format.
 
@@ -1040,13 +3031,369 @@ def read_excel_columns_by_index(file_name: str, tab: str, col_index: List[int],
         1  2  t-shirt   1.8        3
         2  3  coffee    2.1        15
         3  4  books     3.2        40
+
+    Several tabs can be read from a workbook that is opened once, as
+    described in the ``read_excel_columns_by_headers`` function.
     """
-    if not os.path.isfile(file_name):
+    if not isinstance(file_name, pd.ExcelFile) and not os.path.isfile(file_name):
         sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    if chunksize is not None:
+        dat = dict(zip(col_index, data_type))
+        return _excel_chunks(file_name, tab, dict(zip(sorted(col_index), col_names)),
+                             [dat[i] for i in sorted(col_index)], skip, chunksize)
+    if isinstance(file_name, pd.ExcelFile):
+        cache = None
+    if isinstance(tab, list) and cache is not None:
+        return _read_cached_tabs(file_name, tab, ('read_excel_columns_by_index',
+                                                  col_index, col_names, data_type,
+                                                  skip),
+                                 partial(read_excel_columns_by_index,
+                                         col_index=col_index, col_names=col_names,
+                                         data_type=data_type, skip=skip),
+                                 compact, cache)
+    if isinstance(tab, list):
+        with _open_workbook(file_name) as workbook:
+            return {name: read_excel_columns_by_index(workbook, name, col_index,
+                                                      col_names, data_type, skip,
+                                                      compact)
+                    for name in tab}
+    if cache is not None:
+        df = cache.read(file_name, ('read_excel_columns_by_index', tab, col_index,
+                                    col_names, data_type, skip),
+                        partial(read_excel_columns_by_index, file_name, tab,
+                                col_index, col_names, data_type, skip))
+        return compact_dataframe(df) if compact else df
     dat = dict(zip(col_index, data_type))
+    dat = {name: dat[i] for name, i in zip(col_names, sorted(col_index))}
     df = pd.read_excel(file_name, sheet_name=tab, usecols=col_index,
                        names=col_names, dtype=dat, skiprows=skip, header=None)
+    if compact:
+        df = compact_dataframe(df)
+    return df
+# --------------------------------------------------------------------------------
+
+
+def read_excel_files_by_headers(file_names: Union[str, List[str]], tab: str,
+                                headers: List[str], data_type: List[type],
+                                skip: int = 0, processes: int = None,
+                                chunksize: int = 16, source_column: str = 'file',
+                                compact: bool = False,
+                                cache: 'ColumnCache' = None) -> pd.DataFrame:
+    """
+
+    :param file_names: A list of .xls file names to include path-links, or a
+                       glob pattern such as ``data/*.xls`` matching the files
+    :param tab: The tab or sheet name that data will be read from in each file
+    :param headers: A list of the names of the headers that contain
+                    columns which will be read
+    :param data_type: A list containing the data type of each column.  Data
+                      types are limited to ``numpy.int64``, ``numpy.float64``,
+                      and ``str``
+    :param skip: The number of lines to be skipped before reading data
+    :param processes: The number of worker processes.  Defaulted to None,
+                      in which case one process is used per CPU.  A value
+                      of 1 reads the files in the calling process
+    :param chunksize: The number of files sent to a worker process at a
+                      time.  Defaulted to 16
+    :param source_column: The name of a column containing the name of the
+                          file each row was read from.  Defaulted to ``file``.
+                          A value of None does not add the column
+    :param compact: True if numeric columns are stored in the smallest data
+                    type that holds their values and repetitive string columns
+                    are stored as categories, as described in the
+                    ``compact_dataframe`` function.  Defaulted to False
+    :param cache: A ``ColumnCache`` object in which the tab of each file is
+                  saved and from which it is loaded on later reads, as
+                  described in the ``read_excel_columns_by_headers``
+                  function.  Defaulted to None
+    :return df: A pandas dataframe containing the rows of every file that was
+                read.  ``df.attrs['errors']`` is a dictionary mapping the name
+                of each file that could not be read to the reason
+
+    This function reads the same tab and columns from many workbooks that
+    share a format, such as the file ``test.xls`` described in the
+    ``read_excel_columns_by_headers`` function, spreading the files over a
+    pool of processes, since most of the time spent reading a small workbook
+    is spent parsing it.  A file that does not exist, or that does not
+    contain the tab or one of the headers, does not stop the other files
+    from being read.  A glob pattern is expanded in alphabetical order.
+
+    .. code-block:: python
+
+       > headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+       > dat = [int, str, float, int]
+       > df = read_excel_files_by_headers('finance_*.xls', 'primary',
+                                          headers, dat)
+       > print(df)
+           ID Inventory Weight_per Number file
+        0  1  shoes     1.5        5      finance_1.xls
+        1  2  t-shirt   1.8        3      finance_1.xls
+        2  3  coffee    2.1        15     finance_3.xls
+       > print(df.attrs['errors'])
+        {'finance_2.xls': 'ValueError: Worksheet named 'primary' not found'}
+    """
+    if isinstance(file_names, str):
+        file_names = sorted(glob.glob(file_names))
+    if len(file_names) == 0:
+        sys.exit('FATAL ERROR: No files to read')
+    worker = partial(_read_excel_file, tab=tab, headers=headers,
+                     data_type=data_type, skip=skip, cache=cache)
+    if processes == 1:
+        results = [worker(file_name) for file_name in file_names]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(worker, file_names, chunksize=chunksize))
+    frames = [df for df, _ in results if df is not None]
+    read = [file_name for file_name, (df, _) in zip(file_names, results)
+            if df is not None]
+    errors = {file_name: error for file_name, (_, error) in zip(file_names, results)
+              if error is not None}
+    if len(frames) == 0:
+        df = pd.DataFrame(columns=headers + ([source_column] if source_column else []))
+    else:
+        df = _combine_frames(frames, read, source_column)
+    if compact:
+        df = compact_dataframe(df)
+    df.attrs['errors'] = errors
     return df
+# --------------------------------------------------------------------------------
+
+
+def _read_excel_file(file_name: str, tab: str, headers: List[str],
+                     data_type: List[type], skip: int,
+                     cache: 'ColumnCache' = None) -> Tuple[Union[pd.DataFrame, None],
+                                                           Union[str, None]]:
+    """
+
+    :param file_name: The name of the file being read to include the
+                      path-link
+    :param tab: The tab or sheet name that data will be read from
+    :param headers: A list of the names of the headers that contain
+                    columns which will be read
+    :param data_type: A list containing the data type of each column
+    :param skip: The number of lines to be skipped before reading data
+    :param cache: A ``ColumnCache`` object, or None
+    :return result: The dataframe read from the file and None, or None and
+                    the reason the file could not be read
+    """
+    try:
+        df = read_excel_columns_by_headers(file_name, tab, headers, data_type, skip,
+                                           cache=cache)
+    except SystemExit as error:
+        return None, str(error)
+    except Exception as error:
+        return None, '{}: {}'.format(type(error).__name__, error)
+    missing = [name for name in headers if name not in df.columns]
+    if len(missing) > 0:
+        return None, '{} not found in {}'.format(', '.join(missing), file_name)
+    return df, None
+# --------------------------------------------------------------------------------
+
+
+def inspect_excel_workbook(file_name: str, tabs: List[str] = None,
+                           header_rows: int = 1) -> Dict[str, Dict]:
+    """
+
+    :param file_name: The file name to include path-link.  Must be an
+                      .xls file format.  This code will **not** read .xlsx
+    :param tabs: A list of the tab or sheet names to be inspected.
+                 Defaulted to None, in which case every tab is inspected
+    :param header_rows: The number of rows at the top of each tab whose
+                        cells are returned.  Defaulted to 1
+    :return tabs: A dictionary mapping each tab name, in workbook order, to
+                  a dictionary containing the number of ``rows`` and
+                  ``columns`` in the tab and a ``header`` list containing
+                  a list of the cells in each of the first **header_rows**
+                  rows
+
+    This function describes the tabs of a workbook without building a
+    dataframe, so that a user can decide which tabs and columns to read.
+    The workbook is opened with xlrd in on demand mode, so only the tabs
+    that are inspected are parsed, each tab is released once it has been
+    inspected, and no data is converted to a dataframe.  Numbers are
+    returned as floating point values, as they are stored in the workbook.
+    For instance, the file ``test.xls`` described in the
+    ``read_excel_columns_by_headers`` function can be inspected with the
+    following command.
+
+    .. code-block:: python
+
+       > print(inspect_excel_workbook('test.xls'))
+        {'primary': {'rows': 5, 'columns': 4,
+                     'header': [['ID', 'Inventory', 'Weight_per', 'Number']]},
+         'secondary': {'rows': 4, 'columns': 4,
+                       'header': [['ID', 'Inventory', 'Weight_per', 'Number']]}}
+    """
+    if not os.path.isfile(file_name):
+        sys.exit('{}{}{}'.format('FATAL ERROR: ', file_name, ' does not exist'))
+    result = {}
+    with xlrd.open_workbook(file_name, on_demand=True) as book:
+        names = book.sheet_names()
+        for name in names if tabs is None else tabs:
+            if name not in names:
+                sys.exit('{}{}{}{}'.format('FATAL ERROR: ', name, ' not found in ',
+                                           file_name))
+            sheet = book.sheet_by_name(name)
+            result[name] = {'rows': sheet.nrows, 'columns': sheet.ncols,
+                            'header': [sheet.row_values(i) for i in
+                                       range(min(header_rows, sheet.nrows))]}
+            book.unload_sheet(name)
+    return result
+# --------------------------------------------------------------------------------
+
+
+def _excel_chunks(file_name: Union[str, pd.ExcelFile], tab: str,
+                  columns: Union[List[str], Dict[int, str]], data_type: List[type],
+                  skip: int, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+
+    :param file_name: The file name to include path-link, or a
+                      ``pandas.ExcelFile`` object
+    :param tab: The tab or sheet name that data will be read from
+    :param columns: A list of the headers of the columns to be read, or a
+                    dictionary mapping the number of each column to be read
+                    to its name if the tab has no header row
+    :param data_type: A list containing the data type of each column
+    :param skip: The number of rows to be skipped before the header row,
+                 or before the data if the columns are given by number
+    :param chunksize: The number of rows in each dataframe
+    :return df: An iterator of dataframes, each indexed by the position of
+                its rows in the tab.  The columns are in the order they
+                appear in the tab, as they are for the other excel functions
+
+    The tab and headers are checked before the iterator is returned, so
+    that a missing tab or header is reported when this function is called.
+    """
+    opened = not isinstance(file_name, pd.ExcelFile)
+    book = xlrd.open_workbook(file_name, on_demand=True) if opened else file_name.book
+    if tab not in book.sheet_names():
+        sys.exit('{}{}{}{}'.format('FATAL ERROR: ', tab, ' not found in ', file_name))
+    sheet = book.sheet_by_name(tab)
+    dat = dict(zip(columns, data_type))
+    first = skip
+    if not isinstance(columns, dict):
+        row = [str(value) for value in sheet.row_values(skip)] \
+            if sheet.nrows > skip else []
+        for name in columns:
+            if name not in row:
+                sys.exit('{}{}{}{}'.format('FATAL ERROR: ', name, ' not found in ',
+                                           file_name))
+        columns = {row.index(name): name for name in columns}
+        dat = {i: dat[name] for i, name in columns.items()}
+        first = skip + 1
+    return _excel_chunk_frames(book if opened else None, sheet, columns, dat, first,
+                               chunksize)
+# --------------------------------------------------------------------------------
+
+
+def _excel_chunk_frames(book, sheet, columns: Dict[int, str], data_type: Dict[int, type],
+                        first: int, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+
+    :param book: The xlrd workbook that is released when the iterator is
+                 finished, or None if the workbook is kept open
+    :param sheet: The xlrd sheet that data is read from
+    :param columns: A dictionary mapping the number of each column to its name
+    :param data_type: A dictionary mapping the number of each column to its
+                      data type
+    :param first: The number of the first row of data
+    :param chunksize: The number of rows in each dataframe
+    :return df: An iterator of dataframes
+    """
+    try:
+        for start in range(first, max(sheet.nrows, first + 1), chunksize):
+            end = min(start + chunksize, sheet.nrows)
+            df = pd.DataFrame({columns[i]: _excel_values(sheet.col_values(i, start, end),
+                                                         data_type[i])
+                               for i in sorted(columns)},
+                              columns=[columns[i] for i in sorted(columns)])
+            df.index = pd.RangeIndex(start - first, start - first + len(df))
+            yield df
+    finally:
+        if book is not None:
+            book.release_resources()
+# --------------------------------------------------------------------------------
+
+
+def _excel_values(values: List, data_type: type) -> Union[np.ndarray, pd.Series]:
+    """
+
+    :param values: The values of the cells of one column, as returned by xlrd
+    :param data_type: The data type of the column
+    :return values: The values converted to **data_type**.  Empty cells are
+                    read as ``NaN`` in floating point and string columns
+
+    Excel stores every number as a floating point value, so a whole number
+    in a string column is converted without a decimal point, as it is by
+    ``pandas.read_excel``, and a number with a fractional part, or an empty
+    cell, in an integer column raises a ``ValueError`` rather than being
+    truncated.
+    """
+    if data_type is str:
+        strings = [str(int(value)) if isinstance(value, float) and value.is_integer()
+                   else str(value) for value in values]
+        return pd.Series([np.nan if value == '' else value for value in strings],
+                         dtype=str)
+    numbers = np.array([np.nan if value == '' else value for value in values],
+                       dtype=np.float64)
+    if np.dtype(data_type).kind in 'iu' and not np.all(np.mod(numbers, 1) == 0):
+        raise ValueError('Unable to convert a non-integer value to {}'.format(
+            np.dtype(data_type).name))
+    return numbers.astype(data_type)
+# --------------------------------------------------------------------------------
+
+
+def _read_cached_tabs(file_name: str, tab: List[str], options: Tuple, read_tab,
+                      compact: bool, cache: 'ColumnCache') -> Dict[str, pd.DataFrame]:
+    """
+
+    :param file_name: The file name to include path-link
+    :param tab: A list of the tabs to be read
+    :param options: A tuple containing the name of the reading function and
+                    every argument after the tab that affects the data it
+                    returns
+    :param read_tab: A function that reads a tab when passed an open
+                     ``pandas.ExcelFile`` object and the name of the tab
+    :param compact: True if the dataframes are to be compacted
+    :param cache: A ``ColumnCache`` object
+    :return dfs: A dictionary mapping each tab to a pandas dataframe
+
+    Each tab is keyed in the cache in the same way as a single tab read
+    with the reading function.  The workbook is only opened when the first
+    tab that is not in the cache is reached, and the same open workbook is
+    used for every other tab that is not in the cache.
+    """
+    dfs = {}
+    with contextlib.ExitStack() as stack:
+        workbook = []
+
+        def read_file(name: str) -> pd.DataFrame:
+            if not workbook:
+                workbook.append(stack.enter_context(_open_workbook(file_name)))
+            return read_tab(workbook[0], name)
+
+        for name in tab:
+            df = cache.read(file_name, (options[0], name) + options[1:],
+                            partial(read_file, name))
+            dfs[name] = compact_dataframe(df) if compact else df
+    return dfs
+# --------------------------------------------------------------------------------
+
+
+@contextlib.contextmanager
+def _open_workbook(file_name: Union[str, pd.ExcelFile]) -> Iterator[pd.ExcelFile]:
+    """
+
+    :param file_name: The file name to include path-link, or a
+                      ``pandas.ExcelFile`` object
+    :return workbook: A ``pandas.ExcelFile`` object, which is closed on exit
+                      only if it was opened by this function
+    """
+    if isinstance(file_name, pd.ExcelFile):
+        yield file_name
+        return
+    with pd.ExcelFile(file_name) as workbook:
+        yield workbook
 # ================================================================================
 # ================================================================================
 
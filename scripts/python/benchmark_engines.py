@@ -0,0 +1,142 @@
+# Import packages here
+import os
+import sys
+import time
+import tempfile
+import argparse
+import numpy as np
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from core_utilities.read_files import available_csv_engines
+from core_utilities.read_files import read_csv_columns_by_headers
+from core_utilities.read_files import read_text_columns_by_headers
+# ================================================================================
+# ================================================================================
+# Purpose: Reports the throughput of each parser engine available to the csv
+#          and text reading functions
+# Instruction: This code can be run in the following ways
+#              - python benchmark_engines.py # Benchmarks a generated file
+#                                              of 1,000,000 rows
+#              - python benchmark_engines.py --rows 100000 --columns 8
+#              - python benchmark_engines.py --file data.csv --headers A B C
+#                                            --types float float str
+#                                            --skip 2 # Benchmarks an existing
+#                                                       comma delimited file
+
+# Source Code Metadata
+__author__ = "Jonathan A. Webb"
+__copyright__ = "Copyright 2021, Jon Webb Inc."
+__version__ = "1.0"
+# ================================================================================
+# ================================================================================
+# Insert Code here
+
+TYPES = {'int': np.int64, 'float': np.float64, 'str': str}
+
+
+def write_test_file(file_name: str, rows: int, columns: int,
+                    delimiter: str) -> None:
+    """
+
+    :param file_name: The file name to include path-link
+    :param rows: The number of rows of data
+    :param columns: The number of numeric columns
+    :param delimiter: The delimiter written between columns
+
+    This function writes a file with an integer ID column, **columns**
+    floating point columns and a low cardinality string column.
+    """
+    generator = np.random.default_rng(0)
+    names = ['ID'] + ['Value{}'.format(i) for i in range(columns)] + ['Inventory']
+    items = np.array(['shoes', 't-shirt', 'coffee', 'books'])
+    with open(file_name, 'w') as Output_File:
+        Output_File.write(delimiter.join(names) + '\n')
+        for start in range(0, rows, 100000):
+            block = generator.random((min(100000, rows - start), columns))
+            ids = np.arange(start, start + len(block))
+            lines = [delimiter.join([str(ids[i])] + ['{:.6f}'.format(value) for value in row]
+                                    + [items[ids[i] % 4]])
+                     for i, row in enumerate(block)]
+            Output_File.write('\n'.join(lines) + '\n')
+    return
+# --------------------------------------------------------------------------------
+
+
+def benchmark(reader, file_name: str, headers, data_type, skip: int,
+              repeat: int) -> None:
+    """
+
+    :param reader: The reading function being timed
+    :param file_name: The file name to include path-link
+    :param headers: The headers of the columns to be read
+    :param data_type: The data type of each column
+    :param skip: The number of lines to be skipped before the header line
+    :param repeat: The number of times each engine reads the file
+
+    This function prints the best time and throughput of each engine.
+    """
+    size = os.path.getsize(file_name) / 2 ** 20
+    print('{} ({:.1f} MB)'.format(reader.__name__, size))
+    for engine in available_csv_engines():
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            reader(file_name, headers, data_type, skip=skip, engine=engine)
+            times.append(time.perf_counter() - start)
+        print('    {:8s} {:8.3f} s {:10.1f} MB/s'.format(engine, min(times),
+                                                        size / min(times)))
+    return
+# --------------------------------------------------------------------------------
+
+
+def read_space_columns_by_headers(file_name: str, headers, data_type,
+                                  skip: int = 0, engine: str = None):
+    """
+
+    This function reads a text file delimited by a single space, since the
+    pyarrow engine can not read the default white space delimiter.
+    """
+    return read_text_columns_by_headers(file_name, headers, data_type, skip,
+                                        delimiter=' ', engine=engine)
+# --------------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Reports the throughput of '
+                                                 'each parser engine')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--columns', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--file', default=None)
+    parser.add_argument('--headers', nargs='+', default=None)
+    parser.add_argument('--types', nargs='+', choices=list(TYPES), default=None)
+    parser.add_argument('--skip', type=int, default=0)
+    args = parser.parse_args()
+    if args.file is not None and (args.headers is None or args.types is None):
+        parser.error('--file requires --headers and --types')
+    if args.file is not None and len(args.headers) != len(args.types):
+        parser.error('--headers and --types must have the same length')
+    if args.file is not None:
+        data_type = [TYPES[name] for name in args.types]
+        benchmark(read_csv_columns_by_headers, args.file, args.headers,
+                  data_type, args.skip, args.repeat)
+        return
+    headers = ['ID'] + ['Value{}'.format(i) for i in range(args.columns)] + ['Inventory']
+    data_type = [np.int64] + [np.float64] * args.columns + [str]
+    with tempfile.TemporaryDirectory() as directory:
+        csv_file = os.path.join(directory, 'benchmark.csv')
+        write_test_file(csv_file, args.rows, args.columns, ',')
+        benchmark(read_csv_columns_by_headers, csv_file, headers, data_type,
+                  0, args.repeat)
+        text_file = os.path.join(directory, 'benchmark.txt')
+        write_test_file(text_file, args.rows, args.columns, ' ')
+        benchmark(read_space_columns_by_headers, text_file, headers, data_type,
+                  0, args.repeat)
+    return
+# ================================================================================
+# ================================================================================
+
+
+if __name__ == '__main__':
+    main()
+# eof
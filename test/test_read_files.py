@@ -3,17 +3,32 @@ import pytest
 import os
 import sys
 import platform
+import shutil
+import pickle
 import numpy as np
+import pandas as pd
 from math import isclose
 sys.path.insert(0, os.path.abspath('../core_utilities'))
 
+from core_utilities import read_files
 from core_utilities.read_files import ReadTextFileKeywords
+from core_utilities.read_files import keyword_cache_info, clear_keyword_cache
+from core_utilities.read_files import read_keyword_files
 from core_utilities.read_files import read_csv_columns_by_headers
 from core_utilities.read_files import read_csv_columns_by_index
+from core_utilities.read_files import read_csv_files_by_headers
+from core_utilities.read_files import sample_csv_columns_by_headers
+from core_utilities.read_files import ColumnCache, available_csv_engines
+from core_utilities.read_files import compact_dataframe
 from core_utilities.read_files import read_text_columns_by_headers
 from core_utilities.read_files import read_text_columns_by_index
+from core_utilities.read_files import read_text_columns_by_span
+from core_utilities.read_files import read_numeric_columns_by_index
+from core_utilities.read_files import TailColumnReader
 from core_utilities.read_files import read_excel_columns_by_headers
 from core_utilities.read_files import read_excel_columns_by_index
+from core_utilities.read_files import read_excel_files_by_headers
+from core_utilities.read_files import inspect_excel_workbook
 from core_utilities.read_files import ManageSQLiteDB
 from core_utilities.read_files import simple_sqlite_query, read_json_file
 from core_utilities.read_files import read_xml_file, read_yaml_file
@@ -181,6 +196,152 @@ def test_read_integer_list():
 # ------------------------------------------------------------------------------
 
 
+def test_read_list_as_array():
+    """
+
+    This function tests the ReadTextFileKeywords list functions to
+    determine if they can read a variable as a contiguous numpy array
+    """
+    if plat in lin_plat:
+        file = '../data/test/keywords.txt'
+    else:
+        file = r'..\data\test\keywords.txt'
+    key = ReadTextFileKeywords(file)
+    double_value = key.read_double_list('double list:', as_array=True)
+    assert double_value.dtype == np.float64
+    assert np.allclose(double_value, [1.12321, 344.3454453, 21.434553])
+    float_value = key.read_float_list('float list:', as_array=True)
+    assert float_value.dtype == np.float32
+    assert np.allclose(float_value, [1.2, 3.4, 4.5, 5.6, 6.7])
+    int_value = key.read_integer_list('integer list:', as_array=True)
+    assert int_value.dtype == np.int32
+    assert np.array_equal(int_value, [1, 2, 3, 4, 5, 6, 7])
+    comment_value = key.read_double_list('float:', as_array=True)
+    assert np.allclose(comment_value, [3.1415])
+    for as_array in [True, False]:
+        assert list(key.read_integer_list('Integer Value:', as_array=as_array)) == [3]
+        with pytest.raises(ValueError):
+            key.read_double_list('sentence:', as_array=as_array)
+# ------------------------------------------------------------------------------
+
+
+def test_read_list_range(tmp_path):
+    """
+
+    This function tests the ReadTextFileKeywords list functions to
+    determine if they reject integers that do not fit in the data type
+    whether or not the list is read as an array
+    """
+    file = tmp_path / 'range.txt'
+    file.write_text('big: 3000000000\nhuge: 1 99999999999999999999\n'
+                    'small: -2147483648 2147483647\n')
+    key = ReadTextFileKeywords(str(file))
+    for as_array in [True, False]:
+        for key_words in ['big:', 'huge:']:
+            with pytest.raises(ValueError):
+                key.read_integer_list(key_words, as_array=as_array)
+        assert list(key.read_integer_list('small:', as_array=as_array)) == \
+            [-2147483648, 2147483647]
+# ------------------------------------------------------------------------------
+
+
+def test_read_array_block():
+    """
+
+    This function tests the ReadTextFileKeywords.read_array_block
+    function to determine if it can read a table of numbers below a
+    keyword as a two dimensional array
+    """
+    if plat in lin_plat:
+        file = '../data/test/keyword_table.txt'
+    else:
+        file = r'..\data\test\keyword_table.txt'
+    key = ReadTextFileKeywords(file)
+    table = key.read_array_block('temperature table:')
+    expected = np.array([[1.0, 300.0, 301.5], [2.0, 310.0, 311.2],
+                         [3.0, 320.0, 321.8]])
+    assert table.dtype == np.float64
+    assert np.allclose(table, expected)
+    table = key.read_array_block('temperature table:', rows=2)
+    assert np.allclose(table, expected[:2])
+    table = key.read_array_block('count table:', data_type=np.int32)
+    assert table.dtype == np.int32
+    assert np.array_equal(table, [[1, 2], [3, 4]])
+    assert key.read_double('pressure:') == 101.3
+    assert key.read_array_block('pressure:').shape == (0, 0)
+# ------------------------------------------------------------------------------
+
+
+def test_read_array_block_ragged(tmp_path):
+    """
+
+    This function tests the ReadTextFileKeywords.read_array_block
+    function to ensure a table whose rows contain different numbers of
+    values is rejected rather than reshaped
+    """
+    file = tmp_path / 'ragged.txt'
+    file.write_text('table:\n1 2 3\n4 5\n6 7 8 9\n')
+    key = ReadTextFileKeywords(str(file))
+    with pytest.raises(ValueError):
+        key.read_array_block('table:')
+    assert np.array_equal(key.read_array_block('table:', rows=1), [[1, 2, 3]])
+# ------------------------------------------------------------------------------
+
+
+def test_read_stream():
+    """
+
+    This function tests that the ReadTextFileKeywords class returns the
+    same data when the file is searched in stream mode
+    """
+    if plat in lin_plat:
+        file = '../data/test/keywords.txt'
+        table_file = '../data/test/keyword_table.txt'
+    else:
+        file = r'..\data\test\keywords.txt'
+        table_file = r'..\data\test\keyword_table.txt'
+    key = ReadTextFileKeywords(file, stream=True)
+    assert key.read_sentence('sentence:') == "This is a short sentence!"
+    assert key.read_sentence('Integer') == 'Value: 3 # This is an integer comment'
+    assert key.read_float_list('float list:') == [np.float32(value) for value
+                                                 in [1.2, 3.4, 4.5, 5.6, 6.7]]
+    assert key.read_integer_list('integer list:') == [1, 2, 3, 4, 5, 6, 7]
+    with pytest.raises(SystemExit):
+        key.read_sentence('Integer Values:')
+    key = ReadTextFileKeywords(table_file, stream=True)
+    table = key.read_array_block('count table:', data_type=np.int32)
+    assert np.array_equal(table, [[1, 2], [3, 4]])
+    assert key.read_array_block('temperature table:').shape == (3, 3)
+# ------------------------------------------------------------------------------
+
+
+def test_iter_occurrences():
+    """
+
+    This function tests the ReadTextFileKeywords.iter_occurrences and
+    read_occurrences functions to determine if they read the value
+    following every occurrence of a keyword
+    """
+    if plat in lin_plat:
+        file = '../data/test/keyword_log.txt'
+    else:
+        file = r'..\data\test\keyword_log.txt'
+    expected = [1.0e-1, 1.0e-2, 1.0e-3]
+    for stream in [False, True]:
+        key = ReadTextFileKeywords(file, stream=stream)
+        residual = list(key.iter_occurrences('residual:'))
+        assert np.allclose(residual, expected)
+        assert isinstance(residual[0], np.float64)
+        iteration = list(key.iter_occurrences('iteration:', 'integer'))
+        assert iteration == [1, 2, 3]
+        assert isinstance(iteration[0], np.int32)
+        residual = key.read_occurrences('residual:')
+        assert residual.dtype == np.float64
+        assert np.allclose(residual, expected)
+        assert len(key.read_occurrences('pressure:')) == 0
+# ------------------------------------------------------------------------------
+
+
 def test_read_sentence():
     """
 
@@ -233,6 +394,166 @@ def test_read_string_list():
     assert sentence == ['This', 'is', 'a', 'short', 'sentence!']
     for i in sentence:
         assert isinstance(i, str)
+# ------------------------------------------------------------------------------
+
+
+def test_read_keyword_prefix():
+    """
+
+    This function tests that the ReadTextFileKeywords class matches a
+    multi-word keyword as a prefix of a line, returns the first matching
+    line and fails correctly when the keyword is not in the file
+    """
+    if plat in lin_plat:
+        file = '../data/test/keywords.txt'
+    else:
+        file = r'..\data\test\keywords.txt'
+    key = ReadTextFileKeywords(file)
+    assert key.read_sentence('Integer') == 'Value: 3 # This is an integer comment'
+    assert key.read_integer('Integer Value:') == 3
+    assert key.read_sentence('float') == 'list: 1.2 3.4 4.5 5.6 6.7'
+    with pytest.raises(SystemExit):
+        key.read_sentence('Integer Values:')
+# ------------------------------------------------------------------------------
+
+
+def test_read_many():
+    """
+
+    This function tests the ReadTextFileKeywords.read_many function to
+    determine if it reads several variables at once with the same data
+    types as the individual read functions
+    """
+    if plat in lin_plat:
+        file = '../data/test/keywords.txt'
+    else:
+        file = r'..\data\test\keywords.txt'
+    key = ReadTextFileKeywords(file)
+    schema = {'double:': 'double', 'float list:': 'float_list',
+              'Integer Value:': 'integer', 'String:': 'string',
+              'sentence:': 'sentence'}
+    data = key.read_many(schema)
+    assert isclose(data['double:'], 3.141596235941, rel_tol=1.0e-3)
+    assert isinstance(data['double:'], np.float64)
+    assert len(data['float list:']) == 5
+    assert isinstance(data['float list:'][0], np.float32)
+    assert data['Integer Value:'] == 3
+    assert isinstance(data['Integer Value:'], np.int32)
+    assert data['String:'] == 'test'
+    assert data['sentence:'] == 'This is a short sentence!'
+    for data_type in ['double_list', 'integer_list', 'string_list']:
+        method = getattr(key, 'read_' + data_type)
+        expected = method('Integer Value:')
+        assert key.read_many({'Integer Value:': data_type})['Integer Value:'] == expected
+        assert list(key.iter_occurrences('Integer Value:', data_type)) == [expected]
+    with pytest.raises(SystemExit):
+        key.read_many({'double:': 'complex'})
+# ------------------------------------------------------------------------------
+
+
+def test_keyword_cache(tmp_path):
+    """
+
+    This function tests that ReadTextFileKeywords objects share a parse of
+    an unchanged file and parse the file again once it has been modified
+    """
+    file = tmp_path / 'cache.txt'
+    file.write_text('value: 1\n')
+    clear_keyword_cache()
+    assert ReadTextFileKeywords(str(file)).read_integer('value:') == 1
+    assert ReadTextFileKeywords(str(file)).read_integer('value:') == 1
+    info = keyword_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    file.write_text('value: 22\n')
+    assert ReadTextFileKeywords(str(file)).read_integer('value:') == 22
+    assert keyword_cache_info().misses == 2
+    clear_keyword_cache()
+# ------------------------------------------------------------------------------
+
+
+def test_keyword_sidecar(tmp_path, monkeypatch):
+    """
+
+    This function tests that the ReadTextFileKeywords class saves the
+    parsed index of a file to a cache directory, loads it in place of
+    parsing the file, and ignores it once the file has changed
+    """
+    file = tmp_path / 'sidecar.txt'
+    file.write_text('value: 1\n')
+    cache_dir = tmp_path / 'cache'
+    clear_keyword_cache()
+    key = ReadTextFileKeywords(str(file), cache_dir=str(cache_dir))
+    assert key.read_integer('value:') == 1
+    assert len(os.listdir(cache_dir)) == 1
+
+    def fail(file_name):
+        raise AssertionError('file parsed in place of the saved index')
+
+    clear_keyword_cache()
+    with monkeypatch.context() as patch:
+        patch.setattr(read_files, '_index_keyword_file', fail)
+        key = ReadTextFileKeywords(str(file), cache_dir=str(cache_dir))
+        assert key.read_integer('value:') == 1
+    file.write_text('value: 22\n')
+    key = ReadTextFileKeywords(str(file), cache_dir=str(cache_dir))
+    assert key.read_integer('value:') == 22
+    sidecar = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    for contents in [pickle.dumps(5), pickle.dumps((1,)), b'not a pickle']:
+        with open(sidecar, 'wb') as Output_File:
+            Output_File.write(contents)
+        clear_keyword_cache()
+        key = ReadTextFileKeywords(str(file), cache_dir=str(cache_dir))
+        assert key.read_integer('value:') == 22
+    clear_keyword_cache()
+# ------------------------------------------------------------------------------
+
+
+def test_read_keyword_files():
+    """
+
+    This function tests the read_keyword_files function to ensure it reads
+    key words from several files in a process pool and reports the files
+    that could not be read without stopping
+    """
+    if plat in lin_plat:
+        files = ['../data/test/keywords.txt', '../data/test/not_file_found.txt',
+                 '../data/test/keyword_log.txt']
+    else:
+        files = [r'..\data\test\keywords.txt', r'..\data\test\not_file_found.txt',
+                 r'..\data\test\keyword_log.txt']
+    schema = {'double:': 'double', 'String:': 'string'}
+    for processes in [1, 2]:
+        df = read_keyword_files(files, schema, processes=processes, chunksize=1)
+        assert list(df.columns) == ['file', 'double:', 'String:', 'error']
+        assert list(df['file']) == files
+        assert isclose(df['double:'][0], 3.141596235941, rel_tol=1.0e-3)
+        assert df['String:'][0] == 'test'
+        assert pd.isna(df['error'][0])
+        assert 'does not exist' in df['error'][1]
+        assert 'Keywords not found' in df['error'][2]
+# ------------------------------------------------------------------------------
+
+
+def test_read_keyword_files_overflow(tmp_path):
+    """
+
+    This function tests the read_keyword_files function to ensure a value
+    that overflows its data type is reported for its file without stopping
+    the other files
+    """
+    large = str(tmp_path / 'large.txt')
+    small = str(tmp_path / 'small.txt')
+    with open(large, 'w') as Output_File:
+        Output_File.write('steps: 3000000000\n')
+    with open(small, 'w') as Output_File:
+        Output_File.write('steps: 100\n')
+    for processes in [1, 2]:
+        df = read_keyword_files([large, small], {'steps:': 'integer'},
+                                processes=processes)
+        assert df['error'][0].startswith('OverflowError')
+        assert df['steps:'][1] == 100
+        assert pd.isna(df['error'][1])
 # ================================================================================
 # ================================================================================
 # Test read column functions
@@ -364,6 +685,94 @@ def test_read_csv_by_index_below_start():
 # ------------------------------------------------------------------------------
 
 
+def test_read_csv_chunks():
+    """
+
+    This function tests the read_csv_columns_by_headers and
+    read_csv_columns_by_index functions to ensure they return an iterator
+    of typed dataframes when a chunksize is used
+    """
+    if plat in lin_plat:
+        header_file = '../data/test/test2.csv'
+        index_file = '../data/test/test4.csv'
+    else:
+        header_file = r'..\data\test\test2.csv'
+        index_file = r'..\data\test\test4.csv'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    chunks = [read_csv_columns_by_headers(header_file, headers, dat, skip=2,
+                                          chunksize=3),
+              read_csv_columns_by_index(index_file, [0, 1, 2, 3], dat, headers,
+                                        skip=2, chunksize=3)]
+    for reader in chunks:
+        dfs = list(reader)
+        assert [len(df) for df in dfs] == [3, 1]
+        assert list(dfs[0]['ID']) == [1, 2, 3]
+        assert list(dfs[1]['Inventory']) == ['books']
+        assert isinstance(dfs[1]['ID'][3], np.int64)
+        assert isinstance(dfs[1]['Weight_per'][3], np.float64)
+# ------------------------------------------------------------------------------
+
+
+def test_read_csv_files_by_headers():
+    """
+
+    This function tests the read_csv_files_by_headers function to ensure
+    it combines the columns of several csv files into one dataframe
+    """
+    if plat in lin_plat:
+        files = ['../data/test/test1.csv', '../data/test/test1.csv']
+        pattern = '../data/test/test1.csv'
+    else:
+        files = [r'..\data\test\test1.csv', r'..\data\test\test1.csv']
+        pattern = r'..\data\test\test1.csv'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    for processes in [1, 2]:
+        df = read_csv_files_by_headers(files, headers, dat, processes=processes)
+        assert len(df) == 8
+        assert list(df['ID']) == [1, 2, 3, 4, 1, 2, 3, 4]
+        assert list(df['Inventory'][3:5]) == ['books', 'shoes']
+        assert isinstance(df['ID'][5], np.int64)
+        assert isinstance(df['Weight_per'][5], np.float64)
+        assert isinstance(df['Inventory'][5], str)
+    df = read_csv_files_by_headers(files, headers, dat, processes=1,
+                                   source_column='file')
+    assert list(df['file']) == files[:1] * 8
+    df = read_csv_files_by_headers(pattern, headers, dat, processes=1,
+                                   source_column='file')
+    assert list(df['file']) == [pattern] * 4
+    with pytest.raises(SystemExit):
+        read_csv_files_by_headers('../data/test/*.not_csv', headers, dat)
+# ------------------------------------------------------------------------------
+
+
+def test_read_by_headers_in_parallel(tmp_path):
+    """
+
+    This function tests the read_csv_columns_by_headers and
+    read_text_columns_by_headers functions to ensure they return the same
+    dataframe when a file is divided between several processes
+    """
+    headers = ['ID', 'Inventory', 'Number']
+    dat = [np.int64, str, np.int64]
+    lines = ['metadata line', 'ID,Inventory,Weight_per,Number']
+    lines += ['{},item{},{},{}'.format(i, i % 7, i * 0.5, i * 3) for i in range(1000)]
+    csv_file = tmp_path / 'parallel.csv'
+    csv_file.write_text('\n'.join(lines) + '\n')
+    text_file = tmp_path / 'parallel.txt'
+    text_file.write_text('\n'.join(line.replace(',', '  ') for line in lines))
+    serial = read_csv_columns_by_headers(str(csv_file), headers, dat, skip=1)
+    for processes in [2, 3, 7]:
+        df = read_csv_columns_by_headers(str(csv_file), headers, dat, skip=1,
+                                         processes=processes)
+        pd.testing.assert_frame_equal(df, serial)
+        df = read_text_columns_by_headers(str(text_file), headers, dat, skip=1,
+                                          processes=processes)
+        pd.testing.assert_frame_equal(df, serial)
+# ------------------------------------------------------------------------------
+
+
 def test_read_text_by_header():
     """
 
@@ -491,6 +900,386 @@ def test_read_text_by_index_below_start():
 # ------------------------------------------------------------------------------
 
 
+def test_read_text_by_span():
+    """
+
+    This function tests the read_text_columns_by_span function to ensure
+    it properly reads a fixed width text file, in one dataframe or in
+    chunks, to include blank fields and Fortran exponents
+    """
+    if plat in lin_plat:
+        file_name = '../data/test/fixed_width.txt'
+    else:
+        file_name = r'..\data\test\fixed_width.txt'
+    spans = [(0, 3), (4, 16), (16, 25), (25, 34)]
+    names = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    df = read_text_columns_by_span(file_name, spans, dat, names, skip=2)
+
+    new_id = np.array([1, 2, 3, 4, 5], dtype=int)
+    inventory = np.array(['shoes', 't-shirt', 'coffee', 'books', 'caf\u00e9'], dtype=str)
+    weight = np.array([1.5, 1.8, np.nan, 3.2, 4.125], dtype=float)
+    number = np.array([5, 3, 15, 40, -2], dtype=int)
+    assert list(df.columns) == names
+    assert len(df) == 5
+    for i in range(len(df)):
+        assert new_id[i] == df['ID'][i]
+        assert isinstance(df['ID'][i], np.int64)
+        assert inventory[i] == df['Inventory'][i]
+        assert isinstance(df['Inventory'][i], str)
+        assert weight[i] == df['Weight_per'][i] or np.isnan(df['Weight_per'][i])
+        assert isinstance(df['Weight_per'][i], np.float64)
+        assert number[i] == df['Number'][i]
+        assert isinstance(df['Number'][i], np.int64)
+    chunks = list(read_text_columns_by_span(file_name, spans[::-1], dat[::-1],
+                                            names[::-1], skip=2, chunksize=3))
+    assert [len(chunk) for chunk in chunks] == [3, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks), df[names[::-1]])
+# ------------------------------------------------------------------------------
+
+
+def test_read_numeric_columns_by_index():
+    """
+
+    This function tests the read_numeric_columns_by_index function to
+    ensure it reads the numeric columns of a text or csv file into a
+    dictionary of arrays or a two dimensional array
+    """
+    if plat in lin_plat:
+        text_file = '../data/test/textcol4.txt'
+        csv_file = '../data/test/test1.csv'
+    else:
+        text_file = r'..\data\test\textcol4.txt'
+        csv_file = r'..\data\test\test1.csv'
+    data = read_numeric_columns_by_index(text_file, [3, 0, 2],
+                                         [np.int64, np.int64, np.float64],
+                                         ['Number', 'ID', 'Weight_per'], skip=2)
+    assert list(data) == ['Number', 'ID', 'Weight_per']
+    assert data['ID'].dtype == np.int64
+    assert list(data['ID']) == [1, 2, 3, 4]
+    assert list(data['Number']) == [5, 3, 15, 40]
+    assert list(data['Weight_per']) == [1.5, 1.8, 2.1, 3.2]
+    data = read_numeric_columns_by_index(csv_file, [2, 3], skip=1, delimiter=',')
+    assert data[2].dtype == np.float64
+    assert list(data[3]) == [5.0, 3.0, 15.0, 40.0]
+    block = read_numeric_columns_by_index(csv_file, [3, 0], np.int64, skip=1,
+                                          delimiter=',', as_array=True)
+    assert block.shape == (4, 2)
+    assert block.dtype == np.int64
+    assert block[:, 0].tolist() == [5, 3, 15, 40]
+    assert block[:, 1].tolist() == [1, 2, 3, 4]
+# ------------------------------------------------------------------------------
+
+
+def test_read_blank_lines_before_header(tmp_path):
+    """
+
+    This function tests the parallel csv and text functions to ensure blank
+    lines between the skipped lines and the header line are skipped, as
+    they are by the serial functions
+    """
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    file_name = str(tmp_path / 'inventory.csv')
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('metadata\n\n  \nID,Inventory,Weight_per,Number\n')
+        Output_File.write('1,shoes,1.5,5\n2,t-shirt,1.8,3\n3,coffee,2.1,15\n')
+    expected = read_csv_columns_by_headers(file_name, headers, dat, skip=1)
+    assert len(expected) == 3
+    df = read_csv_columns_by_headers(file_name, headers, dat, skip=1, processes=2)
+    pd.testing.assert_frame_equal(df, expected)
+    expected = read_text_columns_by_headers(file_name, headers, dat, skip=1,
+                                            delimiter=',')
+    df = read_text_columns_by_headers(file_name, headers, dat, skip=1,
+                                      delimiter=',', processes=2)
+    pd.testing.assert_frame_equal(df, expected)
+    for engine in available_csv_engines():
+        df = read_csv_columns_by_headers(file_name, headers, dat, skip=1,
+                                         engine=engine)
+        pd.testing.assert_frame_equal(df, expected)
+# ------------------------------------------------------------------------------
+
+
+def test_read_engines():
+    """
+
+    This function tests that the csv and text functions return the same
+    dataframe with every available parser engine, and fall back to the c
+    engine when the pyarrow engine can not be used
+    """
+    if plat in lin_plat:
+        csv_file = '../data/test/test2.csv'
+        text_file = '../data/test/textcol4.txt'
+    else:
+        csv_file = r'..\data\test\test2.csv'
+        text_file = r'..\data\test\textcol4.txt'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    assert available_csv_engines()[:2] == ['c', 'python']
+    expected = read_csv_columns_by_headers(csv_file, headers, dat, skip=2)
+    for engine in available_csv_engines():
+        df = read_csv_columns_by_headers(csv_file, headers, dat, skip=2,
+                                         engine=engine)
+        pd.testing.assert_frame_equal(df, expected)
+        df = read_csv_columns_by_headers(csv_file, headers[::-1], dat[::-1],
+                                         skip=2, engine=engine, processes=2)
+        pd.testing.assert_frame_equal(df, expected)
+    expected = read_text_columns_by_index(text_file, [3, 2, 1, 0], dat[::-1],
+                                          headers, skip=2, delimiter=' ')
+    for engine in available_csv_engines():
+        df = read_text_columns_by_index(text_file, [3, 2, 1, 0], dat[::-1],
+                                        headers, skip=2, delimiter=' ',
+                                        engine=engine)
+        pd.testing.assert_frame_equal(df, expected)
+    expected = read_text_columns_by_index(text_file, [0, 1, 2, 3], dat,
+                                          headers, skip=2)
+    with pytest.warns(UserWarning):
+        df = read_text_columns_by_index(text_file, [0, 1, 2, 3], dat, headers,
+                                        skip=2, engine='pyarrow')
+    pd.testing.assert_frame_equal(df, expected)
+# ------------------------------------------------------------------------------
+
+
+def test_column_cache(tmp_path, monkeypatch):
+    """
+
+    This function tests the ColumnCache class to ensure the csv and text
+    functions return the same dataframe from the cache without parsing
+    the file, and that the least recently used dataframes are removed
+    """
+    if plat in lin_plat:
+        csv_file = '../data/test/test1.csv'
+        text_file = '../data/test/textcol4.txt'
+    else:
+        csv_file = r'..\data\test\test1.csv'
+        text_file = r'..\data\test\textcol4.txt'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    cache = ColumnCache(str(tmp_path / 'cache'))
+    csv_df = read_csv_columns_by_headers(csv_file, headers, dat, cache=cache)
+    text_df = read_text_columns_by_index(text_file, [0, 1, 2, 3], dat, headers,
+                                         skip=2, cache=cache)
+    assert len(os.listdir(cache.directory)) == 2
+
+    def fail(*args, **kwargs):
+        raise AssertionError('file parsed in place of the cached columns')
+
+    mapped = []
+    load = np.load
+
+    def record_load(*args, **kwargs):
+        array = load(*args, **kwargs)
+        if isinstance(array, np.memmap):
+            mapped.append(array)
+        return array
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pd, 'read_csv', fail)
+        patch.setattr(np, 'load', record_load)
+        df = read_csv_columns_by_headers(csv_file, headers, dat, cache=cache)
+        pd.testing.assert_frame_equal(df, csv_df)
+        assert any(np.shares_memory(df['ID'].to_numpy(), array) for array in mapped)
+        df = read_text_columns_by_index(text_file, [0, 1, 2, 3], dat, headers,
+                                        skip=2, cache=cache)
+        pd.testing.assert_frame_equal(df, text_df)
+        df = read_csv_columns_by_headers(csv_file, headers, dat, cache=cache)
+        df.loc[0, 'ID'] = 99
+        assert df.loc[0, 'ID'] == 99
+        df = read_csv_columns_by_headers(csv_file, headers, dat, cache=cache)
+        pd.testing.assert_frame_equal(df, csv_df)
+    for entry in os.listdir(cache.directory):
+        with open(os.path.join(cache.directory, entry, '1.npy'), 'r+b') as Output_File:
+            Output_File.truncate(140)
+    df = read_csv_columns_by_headers(csv_file, headers, dat, cache=cache)
+    pd.testing.assert_frame_equal(df, csv_df)
+    df = read_csv_columns_by_headers(csv_file, headers[:2], dat[:2], cache=cache)
+    assert list(df.columns) == headers[:2]
+    assert len(os.listdir(cache.directory)) == 3
+    cache.max_bytes = 0
+    read_csv_columns_by_headers(csv_file, headers[:3], dat[:3], cache=cache)
+    assert len(os.listdir(cache.directory)) == 1
+    cache.clear()
+    assert len(os.listdir(cache.directory)) == 0
+# ------------------------------------------------------------------------------
+
+
+def test_compact_read(tmp_path):
+    """
+
+    This function tests the compact attribute of the csv, text and excel
+    functions to ensure numeric columns are stored in smaller data types
+    and repetitive string columns are stored as categories, without
+    changing their values
+    """
+    if plat in lin_plat:
+        csv_file = '../data/test/test1.csv'
+        excel_file = '../data/test/excel_test1.xls'
+    else:
+        csv_file = r'..\data\test\test1.csv'
+        excel_file = r'..\data\test\excel_test1.xls'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    expected = read_csv_columns_by_headers(csv_file, headers, dat)
+    df = read_csv_columns_by_headers(csv_file, headers, dat, compact=True)
+    assert df['ID'].dtype == np.int8
+    assert df['Number'].dtype == np.int8
+    assert df['Weight_per'].dtype == np.float64
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert list(df['Number'] - 10) == list(expected['Number'] - 10)
+    df = read_excel_columns_by_headers(excel_file, 'primary', headers, dat,
+                                       compact=True)
+    assert df['ID'].dtype == np.int8
+    rows = ['{},{},{},{}'.format(i, ['shoes', 'coffee'][i % 2], i * 0.5, -i)
+            for i in range(1000)]
+    file_name = str(tmp_path / 'inventory.csv')
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('\n'.join([','.join(headers)] + rows) + '\n')
+    expected = read_csv_columns_by_headers(file_name, headers, dat)
+    df = read_csv_columns_by_headers(file_name, headers, dat, compact=True)
+    assert df['ID'].dtype == np.int16
+    assert df['Inventory'].dtype == 'category'
+    assert df['Weight_per'].dtype == np.float32
+    assert df['Number'].dtype == np.int16
+    assert df.attrs['bytes_saved'] == expected.memory_usage(deep=True).sum() - \
+        df.memory_usage(deep=True).sum()
+    assert df.attrs['bytes_saved'] > 0
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False,
+                                  check_categorical=False)
+    df = compact_dataframe(expected, category_ratio=0.0)
+    assert df['Inventory'].dtype == expected['Inventory'].dtype
+    df = compact_dataframe(pd.DataFrame({'small': np.array([-5, 300]),
+                                         'large': np.array([0, 2 ** 40]),
+                                         'unsigned': np.array([0, 300], dtype=np.uint64)}))
+    assert df['small'].dtype == np.int16
+    assert df['large'].dtype == np.int64
+    assert df['unsigned'].dtype == np.uint16
+    assert list(df['small'] - 10) == [-15, 290]
+# ------------------------------------------------------------------------------
+
+
+def select_shoes(df):
+    """
+
+    This function selects the shoes rows for the where attribute tests.  It
+    is defined at the top level so that it can be sent to worker processes
+    """
+    return df['Inventory'] == 'shoes'
+# ------------------------------------------------------------------------------
+
+
+def test_read_csv_where(tmp_path, monkeypatch):
+    """
+
+    This function tests the where attribute of the csv functions to ensure
+    the file is filtered piece by piece and returns the same rows as
+    filtering the full dataframe
+    """
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    rows = ['{},{},{},{}'.format(i, ['shoes', 'coffee', 'books'][i % 3], i * 0.5,
+                                 i % 25) for i in range(1000)]
+    file_name = str(tmp_path / 'inventory.csv')
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('\n'.join(['metadata', ','.join(headers)] + rows) + '\n')
+    monkeypatch.setattr(read_files, '_WHERE_CHUNKSIZE', 64)
+    full = read_csv_columns_by_headers(file_name, headers, dat, skip=1)
+    expected = full[full['Number'] > 10].reset_index(drop=True)
+    df = read_csv_columns_by_headers(file_name, headers, dat, skip=1,
+                                     where='Number > 10')
+    pd.testing.assert_frame_equal(df, expected)
+    df = read_csv_columns_by_headers(file_name, headers, dat, skip=1,
+                                     where='Number > 10', processes=3)
+    pd.testing.assert_frame_equal(df, expected)
+    expected = full[full['Inventory'] == 'shoes']
+    chunks = list(read_csv_columns_by_headers(file_name, headers, dat, skip=1,
+                                              chunksize=100, where=select_shoes))
+    assert len(chunks) == 10
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+    names = ['id', 'number']
+    df = read_csv_columns_by_index(file_name, [0, 3], [np.int64, np.int64], names,
+                                   skip=2, where='number == 0')
+    assert list(df['id']) == list(range(0, 1000, 25))
+    df = read_csv_files_by_headers([file_name, file_name], headers, dat, skip=1,
+                                   processes=1, where=select_shoes)
+    assert len(df) == 2 * len(expected)
+# ------------------------------------------------------------------------------
+
+
+def test_tail_column_reader(tmp_path):
+    """
+
+    This function tests the TailColumnReader class to ensure each call
+    returns only the complete lines appended since the last call, and
+    that a truncated or replaced file is read from its header line
+    """
+    file_name = str(tmp_path / 'telemetry.txt')
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('Telemetry log\nTime Sensor Temperature\n0.0 a 21.5\n')
+    tail = TailColumnReader(file_name, ['Time', 'Temperature'],
+                            [np.float64, np.float64], skip=1, delimiter=r"\s+")
+    df = tail.read()
+    assert list(df.columns) == ['Time', 'Temperature']
+    assert list(df['Temperature']) == [21.5]
+    assert len(tail.read()) == 0
+    with open(file_name, 'a') as Output_File:
+        Output_File.write('1.0 a 21.6\n2.0 b 21.8\n3.0 b 2')
+    df = tail.read()
+    assert list(df['Time']) == [1.0, 2.0]
+    assert df['Time'].dtype == np.float64
+    with open(file_name, 'a') as Output_File:
+        Output_File.write('2.4\n')
+    assert list(tail.read()['Temperature']) == [22.4]
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('Telemetry log\nTemperature Time\n19.0 4.0\n')
+    df = tail.read()
+    assert list(df.columns) == ['Temperature', 'Time']
+    assert list(df['Time']) == [4.0]
+    os.remove(file_name)
+    assert len(tail.read()) == 0
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('Telemetry log\nTime Sensor Temperature\n')
+        Output_File.write('\n'.join('{} c 20.0'.format(i) for i in range(50)) + '\n')
+    df = tail.read()
+    assert list(df['Time']) == list(range(50))
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('Telemetry log\n\nTime,Temperature\n0.0,21.5\n')
+    tail = TailColumnReader(file_name, ['Time', 'Temperature'],
+                            [np.float64, np.float64], skip=1)
+    pd.testing.assert_frame_equal(tail.read(), read_csv_columns_by_headers(
+        file_name, ['Time', 'Temperature'], [np.float64, np.float64], skip=1))
+# ------------------------------------------------------------------------------
+
+
+def test_sample_csv_columns(tmp_path):
+    """
+
+    This function tests the sample_csv_columns_by_headers function to ensure
+    it returns a reproducible sample of the rows of the file in file order
+    """
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    rows = ['{},{},{},{}'.format(i, ['shoes', 'coffee'][i % 2], i * 0.5, i % 7)
+            for i in range(5000)]
+    file_name = str(tmp_path / 'inventory.csv')
+    with open(file_name, 'w') as Output_File:
+        Output_File.write('\n'.join([','.join(headers)] + rows) + '\n')
+    full = read_csv_columns_by_headers(file_name, headers, dat)
+    df = sample_csv_columns_by_headers(file_name, headers, dat, 1000, chunksize=64)
+    assert len(df) == 1000
+    assert df.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(df, full.loc[df.index])
+    assert abs(df['ID'].mean() - 2500) < 250
+    same = sample_csv_columns_by_headers(file_name, headers, dat, 1000, chunksize=500)
+    other = sample_csv_columns_by_headers(file_name, headers, dat, 1000, seed=1,
+                                          chunksize=64)
+    pd.testing.assert_frame_equal(same, df)
+    assert list(same.index) != list(other.index)
+    df = sample_csv_columns_by_headers(file_name, headers, dat, 6000, chunksize=64)
+    pd.testing.assert_frame_equal(df, full)
+    assert len(sample_csv_columns_by_headers(file_name, headers, dat, 0)) == 0
+# ------------------------------------------------------------------------------
+
+
 def test_read_excel_by_header():
     """
 
@@ -539,6 +1328,249 @@ def test_read_excel_by_header():
 # ------------------------------------------------------------------------------
 
 
+def test_read_excel_tabs(monkeypatch):
+    """
+
+    This function tests the excel functions to ensure a list of tabs is read
+    from a workbook that is opened once, and that an open workbook can be
+    passed in place of the file name
+    """
+    if plat in lin_plat:
+        file_name = '../data/test/excel_test1.xls'
+    else:
+        file_name = r'..\data\test\excel_test1.xls'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    expected = {tab: read_excel_columns_by_headers(file_name, tab, headers, dat)
+                for tab in ['primary', 'secondary']}
+    opened = []
+    init = pd.ExcelFile.__init__
+
+    def count_init(self, *args, **kwargs):
+        opened.append(args[0] if args else kwargs.get('path_or_buffer'))
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.ExcelFile, '__init__', count_init)
+    dfs = read_excel_columns_by_headers(file_name, ['primary', 'secondary'],
+                                        headers, dat)
+    assert len(opened) == 1
+    assert list(dfs) == ['primary', 'secondary']
+    for tab in dfs:
+        pd.testing.assert_frame_equal(dfs[tab], expected[tab])
+    dfs = read_excel_columns_by_index(file_name, ['secondary'], [0, 3],
+                                      ['ID', 'Number'], [np.int64, np.int64], skip=1)
+    assert len(opened) == 2
+    assert list(dfs['secondary']['Number']) == [4, 10, 20]
+    with pd.ExcelFile(file_name) as workbook:
+        ids = read_excel_columns_by_headers(workbook, 'primary', ['ID'], [np.int64])
+        weights = read_excel_columns_by_headers(workbook, 'primary', ['Weight_per'],
+                                                [np.float64])
+    assert len(opened) == 3
+    assert list(ids['ID']) == list(expected['primary']['ID'])
+    assert list(weights['Weight_per']) == list(expected['primary']['Weight_per'])
+# ------------------------------------------------------------------------------
+
+
+def test_read_excel_files_by_headers():
+    """
+
+    This function tests the read_excel_files_by_headers function to ensure
+    it combines the rows of many workbooks with the name of each file, and
+    reports the files that could not be read without stopping
+    """
+    if plat in lin_plat:
+        good = '../data/test/excel_test1.xls'
+        bad = '../data/test/excel_test2.xls'
+        missing = '../data/test/missing.xls'
+    else:
+        good = r'..\data\test\excel_test1.xls'
+        bad = r'..\data\test\excel_test2.xls'
+        missing = r'..\data\test\missing.xls'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    expected = read_excel_columns_by_headers(good, 'secondary', headers, dat)
+    for processes in [1, 2]:
+        df = read_excel_files_by_headers([good, bad, missing, good], 'secondary',
+                                         headers, dat, processes=processes)
+        assert list(df.columns) == headers + ['file']
+        assert len(df) == 2 * len(expected)
+        assert list(df['ID']) == 2 * list(expected['ID'])
+        assert list(df['file']) == 2 * len(expected) * [good]
+        assert sorted(df.attrs['errors']) == sorted([bad, missing])
+        assert 'does not exist' in df.attrs['errors'][missing]
+    df = read_excel_files_by_headers([missing], 'primary', headers, dat,
+                                     source_column=None)
+    assert len(df) == 0
+    assert list(df.columns) == headers
+    assert list(df.attrs['errors']) == [missing]
+# ------------------------------------------------------------------------------
+
+
+def test_excel_column_cache(tmp_path, monkeypatch):
+    """
+
+    This function tests the cache attribute of the excel functions to ensure
+    a tab is loaded from the cache without parsing the workbook, until the
+    workbook is modified
+    """
+    if plat in lin_plat:
+        source = '../data/test/excel_test1.xls'
+    else:
+        source = r'..\data\test\excel_test1.xls'
+    file_name = str(tmp_path / 'excel_test1.xls')
+    shutil.copyfile(source, file_name)
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    cache = ColumnCache(str(tmp_path / 'cache'))
+    expected = read_excel_columns_by_headers(file_name, 'primary', headers, dat,
+                                             cache=cache)
+    by_index = read_excel_columns_by_index(file_name, 'secondary', [0, 2], headers[::2],
+                                           dat[::2], skip=1, cache=cache)
+    assert len(os.listdir(cache.directory)) == 2
+
+    def fail(*args, **kwargs):
+        raise AssertionError('workbook parsed in place of the cached columns')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pd, 'read_excel', fail)
+        df = read_excel_columns_by_headers(file_name, 'primary', headers, dat,
+                                           cache=cache)
+        pd.testing.assert_frame_equal(df, expected)
+        dfs = read_excel_columns_by_index(file_name, ['secondary'], [0, 2],
+                                          headers[::2], dat[::2], skip=1, cache=cache)
+        pd.testing.assert_frame_equal(dfs['secondary'], by_index)
+        df = read_excel_files_by_headers([file_name], 'primary', headers, dat,
+                                         processes=1, cache=cache)
+        assert df.attrs['errors'] == {}
+        assert list(df['ID']) == list(expected['ID'])
+    stats = os.stat(file_name)
+    os.utime(file_name, ns=(stats.st_atime_ns, stats.st_mtime_ns + 10 ** 9))
+    with monkeypatch.context() as patch:
+        patch.setattr(pd, 'read_excel', fail)
+        with pytest.raises(AssertionError):
+            read_excel_columns_by_headers(file_name, 'primary', headers, dat,
+                                          cache=cache)
+    opened = []
+    init = pd.ExcelFile.__init__
+
+    def count_init(self, *args, **kwargs):
+        opened.append(args[0] if args else kwargs.get('path_or_buffer'))
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.ExcelFile, '__init__', count_init)
+    cache.clear()
+    tabs = ['primary', 'secondary']
+    dfs = read_excel_columns_by_index(file_name, tabs, [0, 3], ['ID', 'Number'],
+                                      [np.int64, np.int64], skip=1, cache=cache)
+    assert len(opened) == 1
+    cached = read_excel_columns_by_index(file_name, tabs, [0, 3], ['ID', 'Number'],
+                                         [np.int64, np.int64], skip=1, cache=cache)
+    assert len(opened) == 1
+    for tab in tabs:
+        pd.testing.assert_frame_equal(cached[tab], dfs[tab])
+    read_excel_columns_by_headers(file_name, 'primary', headers, dat, cache=cache)
+    assert len(opened) == 2
+    dfs = read_excel_columns_by_headers(file_name, tabs, headers, dat, cache=cache,
+                                        compact=True)
+    assert len(opened) == 3
+    assert dfs['primary']['ID'].dtype == np.int8
+# ------------------------------------------------------------------------------
+
+
+def test_inspect_excel_workbook():
+    """
+
+    This function tests the inspect_excel_workbook function to ensure it
+    returns the dimensions and first rows of each tab
+    """
+    if plat in lin_plat:
+        file_name = '../data/test/excel_test2.xls'
+    else:
+        file_name = r'..\data\test\excel_test2.xls'
+    tabs = inspect_excel_workbook(file_name, header_rows=3)
+    assert list(tabs) == ['primary', 'secondary']
+    assert tabs['primary']['rows'] == 7
+    assert tabs['primary']['columns'] == 4
+    assert len(tabs['primary']['header']) == 3
+    assert tabs['primary']['header'][0][0] == 'This line is providing file information'
+    assert tabs['primary']['header'][2] == ['ID', 'Inventory', 'Weight_per', 'Number']
+    assert tabs['secondary'] == {'rows': 0, 'columns': 0, 'header': []}
+    tabs = inspect_excel_workbook(file_name, ['primary'])
+    assert list(tabs) == ['primary']
+    assert len(tabs['primary']['header']) == 1
+    with pytest.raises(SystemExit):
+        inspect_excel_workbook(file_name, ['missing'])
+# ------------------------------------------------------------------------------
+
+
+def test_read_excel_chunks():
+    """
+
+    This function tests the chunksize attribute of the excel functions to
+    ensure the pieces of a tab contain the same rows as the full tab
+    """
+    if plat in lin_plat:
+        header_file = '../data/test/excel_test2.xls'
+        index_file = '../data/test/excel_test4.xls'
+    else:
+        header_file = r'..\data\test\excel_test2.xls'
+        index_file = r'..\data\test\excel_test4.xls'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    expected = read_excel_columns_by_headers(header_file, 'primary', headers, dat,
+                                             skip=2)
+    chunks = list(read_excel_columns_by_headers(header_file, 'primary', headers[::-1],
+                                                dat[::-1], skip=2, chunksize=3))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+    expected = read_excel_columns_by_index(index_file, 'primary', [0, 1, 2, 3],
+                                           headers, dat, skip=2)
+    with pd.ExcelFile(index_file) as workbook:
+        chunks = list(read_excel_columns_by_index(workbook, 'primary', [0, 1, 2, 3],
+                                                  headers, dat, skip=2, chunksize=2))
+    assert len(chunks) == 2
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+    with pytest.raises(SystemExit):
+        read_excel_columns_by_headers(header_file, 'primary', headers, dat,
+                                      chunksize=2)
+    expected = read_excel_columns_by_index(index_file, 'primary', [3, 0],
+                                           ['ID', 'Number'], [np.int64, np.int64],
+                                           skip=2)
+    chunks = list(read_excel_columns_by_index(index_file, 'primary', [3, 0],
+                                              ['ID', 'Number'], [np.int64, np.int64],
+                                              skip=2, chunksize=3))
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+    assert list(expected['Number']) == [5, 3, 15, 40]
+# ------------------------------------------------------------------------------
+
+
+def test_read_excel_chunks_blank_cells():
+    """
+
+    This function tests the chunksize attribute of the excel functions to
+    ensure blank cells are read as they are when the full tab is read, and
+    that a fractional number is not truncated in an integer column
+    """
+    if plat in lin_plat:
+        file_name = '../data/test/excel_test5.xls'
+    else:
+        file_name = r'..\data\test\excel_test5.xls'
+    headers = ['ID', 'Inventory', 'Weight_per', 'Number']
+    dat = [np.int64, str, np.float64, np.int64]
+    expected = read_excel_columns_by_headers(file_name, 'primary', headers, dat)
+    chunks = list(read_excel_columns_by_headers(file_name, 'primary', headers, dat,
+                                                chunksize=3))
+    df = pd.concat(chunks)
+    pd.testing.assert_frame_equal(df, expected)
+    assert pd.isna(df['Inventory'][1])
+    assert df['Inventory'][3] == '7'
+    assert np.isnan(df['Weight_per'][2])
+    with pytest.raises(ValueError):
+        list(read_excel_columns_by_headers(file_name, 'fractional', ['ID', 'Number'],
+                                           [np.int64, np.int64], chunksize=3))
+# ------------------------------------------------------------------------------
+
+
 def test_read_excel_by_header_below_start():
     """
 